@@ -0,0 +1,174 @@
+import os
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, IO
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from applicants import crud
+from core.workers import BoundedProcessPool, QueueFullError
+from applicants.parser import parse_resume, parser_version
+from applicants.storage import store_resume
+from applicants.worker import bulk_parse_pool, preferred_identity
+
+ResumeSource = Tuple[str, Union[bytes, Exception]]
+
+def iter_resume_sources(source: Union[str, IO[bytes]]) -> Iterator[ResumeSource]:
+    """
+    Yield (filename, pdf_bytes) for every PDF in a directory or zip archive.
+    Files that cannot be read are yielded as (filename, exception).
+    """
+    if isinstance(source, str) and os.path.isdir(source):
+        for root, _, filenames in os.walk(source):
+            for filename in sorted(filenames):
+                if not filename.lower().endswith('.pdf'):
+                    continue
+                path = os.path.join(root, filename)
+                if os.path.getsize(path) > settings.RESUME_MAX_BYTES:
+                    yield path, Exception(f"File is larger than {settings.RESUME_MAX_BYTES} bytes")
+                    continue
+                try:
+                    with open(path, 'rb') as resume_file:
+                        yield path, resume_file.read()
+                except OSError as e:
+                    yield path, e
+        return
+
+    with zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith('.pdf') or info.filename.startswith('__MACOSX/'):
+                continue
+            if info.file_size > settings.RESUME_MAX_BYTES:
+                yield info.filename, Exception(f"File is larger than {settings.RESUME_MAX_BYTES} bytes")
+                continue
+            try:
+                yield info.filename, archive.read(info)
+            except (zipfile.BadZipFile, OSError) as e:
+                yield info.filename, e
+
+def _entry(filename: str, resume_sha256: str, resume_path: str, parsed) -> Dict[str, Any]:
+    resume_text, skills, parsed_data = parsed
+    fallback_name = os.path.splitext(os.path.basename(filename))[0].replace('_', ' ')
+    name, email = preferred_identity(parsed_data, fallback_name, '')
+    return {
+        'name': name,
+        'email': email,
+        'resume_text': resume_text,
+        'skills': skills,
+        'parsed_data': parsed_data,
+        'resume_path': resume_path,
+        'resume_sha256': resume_sha256,
+        'parser_version': parser_version(),
+        'filename': filename  # as uploaded, for the failure report
+    }
+
+def ingest_resumes(db: Session, sources: Iterator[ResumeSource], pool: Optional[BoundedProcessPool] = None,
+                   batch_size: int = None) -> Dict[str, Any]:
+    """
+    Parse resumes in parallel in `pool` (the shared bulk pool by default) and insert
+    them as applicants in batched transactions. Returns a report with per-file failures
+    and throughput. Raises QueueFullError if the pool is full before anything was created.
+    """
+    pool = pool or bulk_parse_pool
+    batch_size = batch_size or settings.BULK_INGEST_BATCH_SIZE
+    started = time.monotonic()
+
+    report = {"total_files": 0, "created": 0, "cached": 0, "failed": [], "applicant_ids": []}
+    batch: List[Dict[str, Any]] = []
+    # Stored files of entries that failed; removed at the end unless an applicant uses them
+    failed_paths = set()
+
+    def flush_batch():
+        if not batch:
+            return
+        try:
+            applicant_ids = crud.create_applicants_bulk(db, batch)
+            report["created"] += len(applicant_ids)
+            report["applicant_ids"].extend(applicant_ids)
+        except Exception as e:
+            db.rollback()
+            report["failed"].extend({"file": entry['filename'], "error": f"Database error: {str(e)}"} for entry in batch)
+            failed_paths.update(entry['resume_path'] for entry in batch)
+        batch.clear()
+
+    def add_entry(entry):
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            flush_batch()
+
+    # Keep a bounded window of parses in flight so memory stays flat for huge batches
+    max_in_flight = min(pool.max_workers * 4, pool.max_pending)
+    in_flight = {}
+
+    def collect(done):
+        for future in done:
+            filename, resume_sha256, resume_path = in_flight.pop(future)
+            try:
+                add_entry(_entry(filename, resume_sha256, resume_path, future.result()))
+            except Exception as e:
+                report["failed"].append({"file": filename, "error": str(e)})
+                failed_paths.add(resume_path)
+
+    def submit(filename, resume_path):
+        # Other uploads may hold the rest of the pool: wait for one of ours to finish first
+        while True:
+            try:
+                return pool.submit(parse_resume, resume_path=resume_path)
+            except QueueFullError:
+                if not in_flight:
+                    if not report["created"]:
+                        raise
+                    report["failed"].append({"file": filename, "error": "Resume parsing queue is full"})
+                    failed_paths.add(resume_path)
+                    return None
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+    try:
+        for filename, resume_bytes in sources:
+            report["total_files"] += 1
+            if isinstance(resume_bytes, Exception):
+                report["failed"].append({"file": filename, "error": str(resume_bytes)})
+                continue
+
+            try:
+                resume_sha256, resume_path = store_resume(resume_bytes)
+            except OSError as e:
+                report["failed"].append({"file": filename, "error": f"Could not store file: {str(e)}"})
+                continue
+
+            # Identical resumes were already parsed: reuse the cached result
+            cached = crud.get_parsed_resume(db, sha256=resume_sha256, parser_version=parser_version())
+            if cached:
+                report["cached"] += 1
+                add_entry(_entry(filename, resume_sha256, resume_path,
+                                 (cached.resume_text, cached.skills, cached.parsed_data or {})))
+                continue
+
+            try:
+                future = submit(filename, resume_path)
+            except QueueFullError:
+                # Nothing was created: none of the stored files are needed
+                failed_paths.add(resume_path)
+                failed_paths.update(entry['resume_path'] for entry in batch)
+                raise
+            if future is None:
+                continue
+            in_flight[future] = (filename, resume_sha256, resume_path)
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        collect(wait(in_flight).done)
+        flush_batch()
+    finally:
+        # A file may have failed for one entry and been created for another identical one
+        for resume_path in failed_paths:
+            crud.delete_unused_resume(db, resume_path)
+
+    elapsed = time.monotonic() - started
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["files_per_second"] = round(report["total_files"] / elapsed, 2) if elapsed > 0 else 0.0
+    return report
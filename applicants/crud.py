@@ -1,14 +1,22 @@
 
-from sqlalchemy.orm import Session
-from applicants.models import Applicant
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from applicants.models import Applicant, ResumeParseJob, ParseStatus, ParsedResume
 from applicants.schemas import ApplicantCreate
-from typing import Dict, Any
+from matching.crud import (
+    index_applicant_skills, index_new_applicants, refresh_applicant_scores, remove_applicant_from_index,
+    remove_applicant_scores, score_new_applicants
+)
+from typing import Dict, Any, List, Optional
+from core.pagination import keyset_by_id
+from datetime import datetime
 import os
 
-def create_applicant(db: Session, applicant: ApplicantCreate, user_id: int, resume_text: str = None, skills: list = None, parsed_data: Dict[str, Any] = None, resume_path: str = None):
+def _build_applicant(applicant: ApplicantCreate, user_id: int, resume_text: str = None, skills: list = None, parsed_data: Dict[str, Any] = None, resume_path: str = None) -> Applicant:
     parsed_data = parsed_data or {}
     
-    db_applicant = Applicant(
+    return Applicant(
         user_id=user_id,
         name=applicant.name,
         email=applicant.email,
@@ -24,13 +32,71 @@ def create_applicant(db: Session, applicant: ApplicantCreate, user_id: int, resu
         total_experience=parsed_data.get('total_experience', 0.0),
         resume_path=resume_path
     )
+
+def create_applicant(db: Session, applicant: ApplicantCreate, user_id: int, resume_text: str = None, skills: list = None, parsed_data: Dict[str, Any] = None, resume_path: str = None):
+    db_applicant = _build_applicant(applicant, user_id, resume_text, skills, parsed_data, resume_path)
     db.add(db_applicant)
+    db.flush()
+    # A new applicant has no index or score rows to replace
+    index_new_applicants(db, [db_applicant])
+    score_new_applicants(db, [db_applicant])
     db.commit()
     db.refresh(db_applicant)
     return db_applicant
 
-def get_applicants(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Applicant).offset(skip).limit(limit).all()
+def create_applicants_bulk(db: Session, entries: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert parsed resumes as applicants in one transaction.
+    Each entry has name, email, resume_text, skills, parsed_data, resume_path
+    and optionally resume_sha256 and parser_version, which also cache the parse result.
+    Returns the new applicant ids in order.
+    """
+    db_applicants = [
+        _build_applicant(
+            ApplicantCreate(name=entry['name'], email=entry['email']),
+            user_id=entry.get('user_id'),
+            resume_text=entry.get('resume_text'),
+            skills=entry.get('skills'),
+            parsed_data=entry.get('parsed_data'),
+            resume_path=entry.get('resume_path')
+        )
+        for entry in entries
+    ]
+    db.add_all(db_applicants)
+    db.flush()
+    # Index and score the batch together rather than one applicant at a time
+    index_new_applicants(db, db_applicants)
+    score_new_applicants(db, db_applicants)
+    
+    # merge() replaces results of an older parser version; the same resume may appear twice in a batch.
+    # Rows already cached are loaded in one query (and held, as the session only keeps weak
+    # references) so merge() finds them without a SELECT per resume
+    cached = {entry['resume_sha256']: entry for entry in entries if entry.get('resume_sha256')}
+    existing = {row.sha256: row for row in db.query(ParsedResume).filter(ParsedResume.sha256.in_(cached))} if cached else {}
+    for sha256, entry in cached.items():
+        parsed = ParsedResume(
+            sha256=sha256,
+            parser_version=entry.get('parser_version'),
+            resume_path=entry.get('resume_path'),
+            resume_text=entry.get('resume_text'),
+            skills=entry.get('skills') or [],
+            parsed_data=entry.get('parsed_data') or {}
+        )
+        if sha256 in existing:
+            db.merge(parsed)
+        else:
+            db.add(parsed)
+    # Read the ids before commit expires the objects
+    applicant_ids = [db_applicant.id for db_applicant in db_applicants]
+    db.commit()
+    return applicant_ids
+
+def get_applicants(db: Session, limit: int = 100, after_id: Optional[int] = None, fields: Optional[List[str]] = None):
+    """Load only `fields` (column names); the resume text and parsed JSON stay in the database unless asked for"""
+    query = db.query(Applicant)
+    if fields:
+        query = query.options(load_only(*[getattr(Applicant, field) for field in fields]))
+    return keyset_by_id(query, Applicant.id, after_id, limit)
 
 def get_applicant(db: Session, applicant_id: int):
     return db.query(Applicant).filter(Applicant.id == applicant_id).first()
@@ -38,11 +104,15 @@ def get_applicant(db: Session, applicant_id: int):
 def get_applicant_by_user_id(db: Session, user_id: int):
     return db.query(Applicant).filter(Applicant.user_id == user_id).first()
 
-def update_applicant_resume(db: Session, applicant_id: int, resume_text: str, skills: list, parsed_data: Dict[str, Any] = None):
+def update_applicant_resume(db: Session, applicant_id: int, resume_text: str, skills: list, parsed_data: Dict[str, Any] = None, name: str = None, email: str = None):
     parsed_data = parsed_data or {}
     
     db_applicant = db.query(Applicant).filter(Applicant.id == applicant_id).first()
     if db_applicant:
+        if name is not None:
+            db_applicant.name = name
+        if email is not None:
+            db_applicant.email = email
         db_applicant.resume_text = resume_text
         db_applicant.skills = skills
         db_applicant.phone = parsed_data.get('mobile_number')
@@ -53,21 +123,119 @@ def update_applicant_resume(db: Session, applicant_id: int, resume_text: str, sk
         db_applicant.degrees = parsed_data.get('degree', [])
         db_applicant.college_names = parsed_data.get('college_name', [])
         db_applicant.total_experience = parsed_data.get('total_experience', 0.0)
+        index_applicant_skills(db, db_applicant)
+        refresh_applicant_scores(db, db_applicant)
         db.commit()
         db.refresh(db_applicant)
     return db_applicant
 
+def delete_unused_resume(db: Session, resume_path: Optional[str], exclude_applicant_id: int = None) -> bool:
+    """Remove a stored resume file unless an applicant (other than the excluded one) uses it"""
+    if not resume_path:
+        return False
+    query = db.query(Applicant.id).filter(Applicant.resume_path == resume_path)
+    if exclude_applicant_id is not None:
+        query = query.filter(Applicant.id != exclude_applicant_id)
+    if query.first() or not os.path.exists(resume_path):
+        return False
+    try:
+        os.remove(resume_path)
+        return True
+    except OSError:
+        return False  # File might already be deleted or permission issues
+
 def delete_applicant(db: Session, applicant_id: int):
-    db_applicant = db.query(Applicant).filter(Applicant.id == applicant_id).first()
+    db_applicant = db.get(Applicant, applicant_id)
     if db_applicant:
-        # Delete associated resume file if it exists
-        if db_applicant.resume_path and os.path.exists(db_applicant.resume_path):
-            try:
-                os.remove(db_applicant.resume_path)
-            except OSError:
-                pass  # File might already be deleted or permission issues
+        # Delete associated resume file if it exists and no other applicant shares it
+        delete_unused_resume(db, db_applicant.resume_path, exclude_applicant_id=applicant_id)
         
+        remove_applicant_from_index(db, applicant_id)
+        remove_applicant_scores(db, applicant_id)
         db.delete(db_applicant)
         db.commit()
         return True
     return False
+
+def create_parse_job(db: Session, job_id: str, applicant_id: int, owner: Optional[str] = None):
+    db_job = ResumeParseJob(
+        id=job_id,
+        applicant_id=applicant_id,
+        status=ParseStatus.queued,
+        owner=owner,
+        heartbeat_at=datetime.utcnow() if owner else None
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def get_parse_job(db: Session, job_id: str):
+    """The parse job with its applicant's owner, for the permission check, in one query"""
+    return db.query(ResumeParseJob).options(
+        joinedload(ResumeParseJob.applicant).load_only(Applicant.id, Applicant.user_id)
+    ).filter(ResumeParseJob.id == job_id).first()
+
+def get_orphaned_parse_jobs(db: Session, stale_before: datetime) -> List[ResumeParseJob]:
+    """Queued parse jobs whose owning process has stopped sending heartbeats, with their applicants"""
+    return db.query(ResumeParseJob).options(joinedload(ResumeParseJob.applicant)).filter(
+        ResumeParseJob.status == ParseStatus.queued,
+        or_(ResumeParseJob.heartbeat_at.is_(None), ResumeParseJob.heartbeat_at < stale_before)
+    ).all()
+
+def claim_parse_job(db: Session, job_id: str, owner: str, stale_before: datetime) -> bool:
+    """
+    Take over an orphaned parse job. The conditional UPDATE lets exactly one
+    process win when several restart at once; returns whether this one did.
+    """
+    claimed = db.query(ResumeParseJob).filter(
+        ResumeParseJob.id == job_id,
+        ResumeParseJob.status == ParseStatus.queued,
+        or_(ResumeParseJob.heartbeat_at.is_(None), ResumeParseJob.heartbeat_at < stale_before)
+    ).update({"owner": owner, "heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+    return claimed == 1
+
+def touch_parse_jobs(db: Session, owner: str) -> int:
+    """Refresh the heartbeat of every queued job `owner` is parsing"""
+    touched = db.query(ResumeParseJob).filter(
+        ResumeParseJob.owner == owner,
+        ResumeParseJob.status == ParseStatus.queued
+    ).update({"heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+    return touched
+
+def finish_parse_job(db: Session, job_id: str, error: str = None):
+    db_job = db.query(ResumeParseJob).filter(ResumeParseJob.id == job_id).first()
+    if db_job:
+        db_job.status = ParseStatus.failed if error else ParseStatus.completed
+        db_job.error = error
+        db_job.finished_at = datetime.utcnow()
+        db.commit()
+    return db_job
+
+def get_parsed_resume(db: Session, sha256: str, parser_version: str):
+    """The cached parse of a resume, None if it was parsed by another parser version"""
+    return db.query(ParsedResume).filter(
+        ParsedResume.sha256 == sha256,
+        ParsedResume.parser_version == parser_version
+    ).first()
+
+def save_parsed_resume(db: Session, sha256: str, parser_version: str, resume_path: str, resume_text: str, skills: list, parsed_data: Dict[str, Any] = None):
+    # merge() replaces a result left by an older parser version
+    db_parsed = db.merge(ParsedResume(
+        sha256=sha256,
+        parser_version=parser_version,
+        resume_path=resume_path,
+        resume_text=resume_text,
+        skills=skills or [],
+        parsed_data=parsed_data or {}
+    ))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker cached the same resume first
+        db.rollback()
+        return get_parsed_resume(db, sha256, parser_version)
+    db.refresh(db_parsed)
+    return db_parsed
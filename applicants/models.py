@@ -1,8 +1,14 @@
 
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, Float, DateTime
+from sqlalchemy import Column, Integer, String, JSON, ForeignKey, Float, DateTime, Enum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
+import enum
+
+class ParseStatus(enum.Enum):
+    queued = "queued"
+    completed = "completed"
+    failed = "failed"
 
 class Applicant(Base):
     __tablename__ = "applicants"
@@ -11,7 +17,7 @@ class Applicant(Base):
     name = Column(String, index=True)
     email = Column(String, index=True)
     phone = Column(String, nullable=True)
-    resume_path = Column(String, nullable=True)
+    resume_path = Column(String, nullable=True, index=True)
     resume_text = Column(String, nullable=True)
     skills = Column(JSON, nullable=True, default=list)
     education = Column(JSON, nullable=True, default=list)
@@ -21,10 +27,39 @@ class Applicant(Base):
     degrees = Column(JSON, nullable=True, default=list)
     college_names = Column(JSON, nullable=True, default=list)
     total_experience = Column(Float, nullable=True, default=0.0)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
     user = relationship("User", back_populates="applicant_profile")
     interviews = relationship("Interview", back_populates="applicant")
     offers = relationship("OfferLetter", back_populates="applicant")
+    parse_jobs = relationship("ResumeParseJob", back_populates="applicant")
+
+class ResumeParseJob(Base):
+    __tablename__ = "resume_parse_jobs"
+
+    id = Column(String, primary_key=True, index=True)
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), nullable=True, index=True)
+    status = Column(Enum(ParseStatus), default=ParseStatus.queued)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    # The process parsing a queued job, and when it last confirmed it is still alive
+    owner = Column(String, nullable=True, index=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    applicant = relationship("Applicant", back_populates="parse_jobs")
+
+class ParsedResume(Base):
+    """Parse results cached by the SHA-256 of the resume PDF, valid for one parser version"""
+    __tablename__ = "parsed_resumes"
+
+    sha256 = Column(String, primary_key=True)
+    parser_version = Column(String, nullable=True)
+    resume_path = Column(String, nullable=True)
+    resume_text = Column(String, nullable=True)
+    skills = Column(JSON, nullable=True, default=list)
+    parsed_data = Column(JSON, nullable=True, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow)
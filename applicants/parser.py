@@ -1,11 +1,17 @@
 
 import PyPDF2
+import hashlib
+import json
 import re
+import time
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from io import BytesIO
-import tempfile
 import os
 
+from core.config import settings
+from applicants.skills import get_skill_extractor, load_skill_dictionary
+
 # Try to import pyresparser, fallback to basic parsing if not available
 try:
     from pyresparser import ResumeParser
@@ -14,47 +20,63 @@ except ImportError:
     PYRESPARSER_AVAILABLE = False
     print("Warning: pyresparser not available, using basic parsing")
 
-def extract_text_from_pdf(pdf_bytes: bytes) -> str:
-    """Extract text from PDF resume"""
+# Bump when a parsing change should invalidate cached parse results
+PARSER_REVISION = 3
+
+@lru_cache(maxsize=1)
+def parser_version() -> str:
+    """
+    Fingerprint of everything that shapes a parse result: the parsing code,
+    whether pyresparser is in use, the skill dictionary and the extraction budgets.
+    Cached parses from another version are ignored.
+    """
+    fingerprint = {
+        "revision": PARSER_REVISION,
+        "pyresparser": PYRESPARSER_AVAILABLE,
+        "skills": load_skill_dictionary(settings.SKILL_DICTIONARY_PATH),
+        "limits": [settings.RESUME_MAX_BYTES, settings.RESUME_MAX_PAGES, settings.RESUME_EXTRACT_SECONDS, settings.RESUME_MAX_TEXT_CHARS]
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+def extract_resume_text(pdf_bytes: bytes, max_pages: int = None, max_seconds: float = None, max_chars: int = None) -> tuple[str, bool]:
+    """
+    Extract text from PDF resume, stopping early once the page, time or text budget is spent.
+    Returns: (text, complete) where complete is False if any budget cut the resume short
+    """
+    if len(pdf_bytes) > settings.RESUME_MAX_BYTES:
+        raise Exception(f"Resume PDF is larger than {settings.RESUME_MAX_BYTES} bytes")
+    max_pages = settings.RESUME_MAX_PAGES if max_pages is None else max_pages
+    max_seconds = settings.RESUME_EXTRACT_SECONDS if max_seconds is None else max_seconds
+    max_chars = settings.RESUME_MAX_TEXT_CHARS if max_chars is None else max_chars
+    deadline = time.monotonic() + max_seconds
+
     try:
         pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        page_count = len(pdf_reader.pages)
+        pages = []
+        collected = 0
+        for page_number, page in enumerate(pdf_reader.pages):
+            if page_number >= max_pages or time.monotonic() > deadline:
+                break
+            page_text = page.extract_text() or ""
+            pages.append(page_text)
+            collected += len(page_text)
+            # Enough text for skill extraction
+            if collected >= max_chars:
+                break
+        complete = len(pages) == page_count and collected <= max_chars
+        return "".join(pages)[:max_chars], complete
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {str(e)}")
 
+def extract_text_from_pdf(pdf_bytes: bytes, max_pages: int = None, max_seconds: float = None, max_chars: int = None) -> str:
+    """Extract text from PDF resume, stopping early once the budgets are spent"""
+    text, _ = extract_resume_text(pdf_bytes, max_pages=max_pages, max_seconds=max_seconds, max_chars=max_chars)
+    return text
+
 def extract_skills_from_text_basic(text: str) -> List[str]:
-    """Basic skill extraction using keyword matching (fallback method)"""
-    skill_keywords = [
-        # Programming languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css',
-        
-        # Frameworks and libraries
-        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
-        'fastapi', 'bootstrap', 'jquery', 'tensorflow', 'pytorch', 'pandas', 'numpy',
-        
-        # Databases
-        'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
-        
-        # Tools and technologies
-        'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins', 'linux', 'windows',
-        'jira', 'agile', 'scrum', 'ci/cd', 'devops', 'microservices', 'rest api', 'graphql',
-        
-        # Soft skills
-        'leadership', 'communication', 'teamwork', 'problem solving', 'project management',
-        'analytical', 'creative', 'adaptable', 'detail oriented'
-    ]
-    
-    text_lower = text.lower()
-    found_skills = []
-    for skill in skill_keywords:
-        if skill.lower() in text_lower:
-            found_skills.append(skill.title())
-    
-    return list(set(found_skills))
+    """Basic skill extraction using the compiled skill dictionary (fallback method)"""
+    return get_skill_extractor().extract(text)
 
 def extract_contact_info_basic(text: str) -> Dict[str, Optional[str]]:
     """Basic contact information extraction"""
@@ -78,55 +100,113 @@ def extract_contact_info_basic(text: str) -> Dict[str, Optional[str]]:
     
     return contact_info
 
-def parse_resume_with_pyresparser(pdf_bytes: bytes) -> Dict[str, Any]:
-    """Parse resume using the advanced ResumeParser library"""
+class _CachedSpacy:
+    """Stand-in for the spacy module inside pyresparser that loads each model once per process"""
+
+    def __init__(self, spacy_module):
+        self._spacy = spacy_module
+        self._models = {}
+
+    def load(self, name, *args, **kwargs):
+        if name not in self._models:
+            self._models[name] = self._spacy.load(name, *args, **kwargs)
+        return self._models[name]
+
+    def __getattr__(self, attr):
+        return getattr(self._spacy, attr)
+
+def load_resume_models() -> None:
+    """
+    Load the pyresparser spaCy models once for this process.
+    ResumeParser calls spacy.load() on every instantiation; route those calls
+    through a per-process cache. Used as the parse worker pool initializer.
+    """
+    if not PYRESPARSER_AVAILABLE:
+        return
+    from pyresparser import resume_parser
+    if isinstance(resume_parser.spacy, _CachedSpacy):
+        return
+    resume_parser.spacy = _CachedSpacy(resume_parser.spacy)
+    resume_parser.spacy.load('en_core_web_sm')
+    resume_parser.spacy.load(os.path.dirname(os.path.abspath(resume_parser.__file__)))
+
+def parse_resume_with_pyresparser(pdf_bytes: bytes = None, resume_path: str = None) -> Dict[str, Any]:
+    """
+    Parse resume using the advanced ResumeParser library.
+    Reads the file the caller already stored at resume_path, or the bytes
+    from memory; nothing is written to disk here.
+    """
     try:
-        # Create a temporary file to save the PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(pdf_bytes)
-            temp_file_path = temp_file.name
+        load_resume_models()
         
-        try:
-            # Parse the resume using ResumeParser
-            data = ResumeParser(temp_file_path).get_extracted_data()
-            
-            # Clean up and format the extracted data
-            parsed_data = {
-                'name': data.get('name', ''),
-                'email': data.get('email', ''),
-                'mobile_number': data.get('mobile_number', ''),
-                'skills': data.get('skills', []),
-                'education': data.get('education', []),
-                'experience': data.get('experience', []),
-                'company_names': data.get('company_names', []),
-                'designation': data.get('designation', []),
-                'degree': data.get('degree', []),
-                'college_name': data.get('college_name', []),
-                'total_experience': data.get('total_experience', 0)
-            }
-            
-            return parsed_data
-            
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        if resume_path:
+            source = resume_path
+        else:
+            # ResumeParser accepts BytesIO and reads the file type from its name
+            source = BytesIO(pdf_bytes)
+            source.name = 'resume.pdf'
+        
+        # Parse the resume using ResumeParser
+        data = ResumeParser(source).get_extracted_data()
+        
+        # Clean up and format the extracted data
+        parsed_data = {
+            'name': data.get('name', ''),
+            'email': data.get('email', ''),
+            'mobile_number': data.get('mobile_number', ''),
+            'skills': data.get('skills', []),
+            'education': data.get('education', []),
+            'experience': data.get('experience', []),
+            'company_names': data.get('company_names', []),
+            'designation': data.get('designation', []),
+            'degree': data.get('degree', []),
+            'college_name': data.get('college_name', []),
+            'total_experience': data.get('total_experience', 0)
+        }
+        
+        return parsed_data
                 
     except Exception as e:
         raise Exception(f"Error parsing resume with ResumeParser: {str(e)}")
 
-def parse_resume(pdf_bytes: bytes) -> tuple[str, List[str], Dict[str, Any]]:
+def parse_basic(text: str) -> tuple[List[str], Dict[str, Any]]:
+    """Skills and contact details from the extracted text alone"""
+    skills = extract_skills_from_text_basic(text)
+    contact_info = extract_contact_info_basic(text)
+
+    parsed_data = {
+        'name': contact_info.get('name', ''),
+        'email': contact_info.get('email', ''),
+        'mobile_number': contact_info.get('phone', ''),
+        'skills': skills,
+        'education': [],
+        'experience': [],
+        'company_names': [],
+        'designation': [],
+        'degree': [],
+        'college_name': [],
+        'total_experience': 0
+    }
+    return skills, parsed_data
+
+def parse_resume(pdf_bytes: bytes = None, resume_path: str = None) -> tuple[str, List[str], Dict[str, Any]]:
     """
     Parse resume PDF and extract text, skills, and additional information
+    Pass the bytes, or the path of a resume that is already stored.
     Returns: (text, skills, parsed_data)
     """
+    if pdf_bytes is None:
+        with open(resume_path, 'rb') as resume_file:
+            pdf_bytes = resume_file.read()
+    
     # Always extract text using PyPDF2
-    text = extract_text_from_pdf(pdf_bytes)
+    text, complete = extract_resume_text(pdf_bytes)
     
-    # Try advanced parsing first, fallback to basic if needed
-    if PYRESPARSER_AVAILABLE:
+    # ResumeParser reads the whole PDF with no budget, so only resumes that
+    # fit the extraction limits are handed to it
+    if PYRESPARSER_AVAILABLE and complete:
         try:
-            parsed_data = parse_resume_with_pyresparser(pdf_bytes)
+            parsed_data = parse_resume_with_pyresparser(pdf_bytes, resume_path=resume_path)
             
             # Use parsed skills if available, otherwise fallback
             skills = parsed_data.get('skills', [])
@@ -140,45 +220,10 @@ def parse_resume(pdf_bytes: bytes) -> tuple[str, List[str], Dict[str, Any]]:
             
         except Exception as e:
             print(f"Advanced parsing failed, using basic parsing: {str(e)}")
-            # Fallback to basic parsing
-            skills = extract_skills_from_text_basic(text)
-            contact_info = extract_contact_info_basic(text)
-            
-            parsed_data = {
-                'name': contact_info.get('name', ''),
-                'email': contact_info.get('email', ''),
-                'mobile_number': contact_info.get('phone', ''),
-                'skills': skills,
-                'education': [],
-                'experience': [],
-                'company_names': [],
-                'designation': [],
-                'degree': [],
-                'college_name': [],
-                'total_experience': 0
-            }
-            
-            return text, skills, parsed_data
-    else:
-        # Basic parsing only
-        skills = extract_skills_from_text_basic(text)
-        contact_info = extract_contact_info_basic(text)
-        
-        parsed_data = {
-            'name': contact_info.get('name', ''),
-            'email': contact_info.get('email', ''),
-            'mobile_number': contact_info.get('phone', ''),
-            'skills': skills,
-            'education': [],
-            'experience': [],
-            'company_names': [],
-            'designation': [],
-            'degree': [],
-            'college_name': [],
-            'total_experience': 0
-        }
-        
-        return text, skills, parsed_data
+
+    # Basic parsing only
+    skills, parsed_data = parse_basic(text)
+    return text, skills, parsed_data
 
 # Legacy function for backward compatibility
 def extract_skills_from_text(text: str) -> List[str]:
@@ -1,27 +1,50 @@
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
-import os
+from typing import List, Optional
 import uuid
+import zipfile
 
-from database import get_db
+from database import get_db, WriterTimeoutError
+from core.config import settings
+from core.pagination import decode_id_cursor, page_by_id
+from core.responses import FastJSONResponse, model_response
 from auth.router import get_current_user, require_role
-from auth.models import User
+from auth.cache import UserPrincipal
 from applicants import schemas, crud
-from applicants.parser import parse_resume
+from applicants.worker import WORKER_ID, submit_resume_parse, preferred_identity
+from applicants.storage import store_resume
+from applicants.parser import parser_version
+from applicants.bulk import iter_resume_sources, ingest_resumes
+from core.workers import QueueFullError
 
 router = APIRouter()
 
-@router.post("/", response_model=schemas.Applicant)
-async def register_applicant(
+applicant_summaries_adapter = TypeAdapter(List[schemas.ApplicantSummary])
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate a comma-separated fields= projection; id is always included"""
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in schemas.DETAIL_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return ["id"] + [field for field in dict.fromkeys(requested) if field != "id"]
+
+@router.post("/", response_model=schemas.ResumeParseJob, status_code=202)
+def register_applicant(
     name: str = Form(...),
     email: str = Form(...),
     resume: UploadFile = File(...),
-    current_user: User = Depends(require_role("applicant")),
+    current_user: UserPrincipal = Depends(require_role("applicant")),
     db: Session = Depends(get_db)
 ):
-    """Register applicant and upload resume PDF"""
+    """
+    Register applicant and upload resume PDF; the resume is parsed in the background.
+    A plain def so its database writes, which may wait for the SQLite writer, run in the threadpool.
+    """
     # Check if applicant already exists for this user
     existing_applicant = crud.get_applicant_by_user_id(db, user_id=current_user.id)
     if existing_applicant:
@@ -31,59 +54,136 @@ async def register_applicant(
     if not resume.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
     
+    # Read at most one byte past the limit so oversized uploads are never buffered whole
+    resume_bytes = resume.file.read(settings.RESUME_MAX_BYTES + 1)
+    if len(resume_bytes) > settings.RESUME_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Resume must be at most {settings.RESUME_MAX_BYTES // (1024 * 1024)} MB")
+    
     try:
-        # Create unique filename for resume
-        file_extension = os.path.splitext(resume.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        resume_path = os.path.join("uploads", unique_filename)
+        # Store the resume once under its content hash
+        resume_sha256, resume_path = store_resume(resume_bytes)
         
-        # Save resume file to local storage
-        resume_bytes = await resume.read()
-        with open(resume_path, "wb") as buffer:
-            buffer.write(resume_bytes)
+        # Identical resumes were already parsed: reuse the cached result
+        cached = crud.get_parsed_resume(db, sha256=resume_sha256, parser_version=parser_version())
+        if cached:
+            parsed_name, parsed_email = preferred_identity(cached.parsed_data or {}, name, email)
+            applicant = crud.create_applicant(
+                db=db,
+                applicant=schemas.ApplicantCreate(name=parsed_name, email=parsed_email),
+                user_id=current_user.id,
+                resume_text=cached.resume_text,
+                skills=cached.skills,
+                parsed_data=cached.parsed_data,
+                resume_path=resume_path
+            )
+            parse_job = crud.create_parse_job(db, job_id=str(uuid.uuid4()), applicant_id=applicant.id, owner=WORKER_ID)
+            return crud.finish_parse_job(db, parse_job.id)
         
-        # Parse resume
-        resume_text, skills, parsed_data = parse_resume(resume_bytes)
-        
-        # Use parsed name and email if not provided or if parsed data is better
-        parsed_name = parsed_data.get('name', name) if parsed_data.get('name') else name
-        parsed_email = parsed_data.get('email', email) if parsed_data.get('email') else email
-        
-        # Create applicant profile
-        applicant_data = schemas.ApplicantCreate(name=parsed_name, email=parsed_email)
-        return crud.create_applicant(
+        # Create the applicant profile now; skills and parsed details are filled in by the parser
+        applicant = crud.create_applicant(
             db=db, 
-            applicant=applicant_data, 
+            applicant=schemas.ApplicantCreate(name=name, email=email), 
             user_id=current_user.id,
-            resume_text=resume_text,
-            skills=skills,
-            parsed_data=parsed_data,
             resume_path=resume_path
         )
+        parse_job = crud.create_parse_job(db, job_id=str(uuid.uuid4()), applicant_id=applicant.id, owner=WORKER_ID)
+    except WriterTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+    
+    try:
+        # parse_job was just refreshed; applicant.id would reload the expired applicant
+        submit_resume_parse(parse_job.id, parse_job.applicant_id, resume_sha256, resume_path, name=name, email=email)
+    except Exception as e:
+        # Nothing will ever parse this resume, so undo the registration
+        queue_full = isinstance(e, QueueFullError)
+        crud.delete_applicant(db, applicant_id=parse_job.applicant_id)
+        crud.finish_parse_job(db, parse_job.id, error="Resume parsing queue is full" if queue_full else f"Could not queue resume: {str(e)}")
+        if queue_full:
+            raise HTTPException(
+                status_code=503,
+                detail="Too many resumes are being processed, please try again shortly",
+                headers={"Retry-After": "30"}
+            )
+        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+    
+    return parse_job
+
+@router.post("/bulk", response_model=schemas.BulkIngestReport)
+def bulk_ingest_applicants(
+    archive: UploadFile = File(...),
+    current_user: UserPrincipal = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Create applicants from a zip of resume PDFs, parsed in parallel"""
+    if not zipfile.is_zipfile(archive.file):
+        raise HTTPException(status_code=400, detail="Upload a zip archive of PDF resumes")
+    archive.file.seek(0)
+    
+    try:
+        return ingest_resumes(db, iter_resume_sources(archive.file))
+    except QueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many resumes are being processed, please try again shortly",
+            headers={"Retry-After": "30"}
+        )
 
-@router.get("/", response_model=List[schemas.Applicant])
+@router.get("/parse-jobs/{job_id}", response_model=schemas.ResumeParseJob)
+def get_parse_job(
+    job_id: str,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status of a background resume parse"""
+    parse_job = crud.get_parse_job(db, job_id=job_id)
+    if parse_job is None:
+        raise HTTPException(status_code=404, detail="Parse job not found")
+    
+    # Applicants can only view their own parse jobs, companies can view all
+    if current_user.role.value == "applicant" and (
+        parse_job.applicant is None or parse_job.applicant.user_id != current_user.id
+    ):
+        raise HTTPException(status_code=403, detail="Not authorized to view this parse job")
+    
+    return parse_job
+
+@router.get("/", response_model=List[schemas.ApplicantSummary])
 def list_applicants(
-    skip: int = 0, 
-    limit: int = 100,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return instead of the summary"),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """List applicants - companies see all, applicants see only their own"""
+    after_id = decode_id_cursor(cursor)
+    projection = parse_fields(fields)
     if current_user.role.value == "company":
-        return crud.get_applicants(db, skip=skip, limit=limit)
+        applicants = crud.get_applicants(db, limit=limit + 1, after_id=after_id, fields=projection or schemas.SUMMARY_FIELDS)
+        applicants = page_by_id(applicants, limit, response)
     elif current_user.role.value == "applicant":
         # Return only the current user's applicant profile
         applicant = crud.get_applicant_by_user_id(db, user_id=current_user.id)
-        return [applicant] if applicant else []
+        applicants = [applicant] if applicant else []
     else:
         raise HTTPException(status_code=403, detail="Not authorized")
+    
+    if projection is None:
+        return model_response(applicant_summaries_adapter, applicants, headers=response.headers)
+    # Send exactly the requested fields rather than the summary model
+    next_cursor = response.headers.get("X-Next-Cursor")
+    return FastJSONResponse(
+        [{field: getattr(applicant, field) for field in projection} for applicant in applicants],
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None
+    )
 
-@router.get("/{applicant_id}", response_model=schemas.Applicant)
+@router.get("/{applicant_id}", response_model=schemas.ApplicantDetail)
 def get_applicant(
     applicant_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get applicant details"""
@@ -100,7 +200,7 @@ def get_applicant(
 @router.delete("/{applicant_id}")
 def delete_applicant(
     applicant_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete applicant"""
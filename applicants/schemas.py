@@ -2,27 +2,58 @@
 from pydantic import BaseModel
 from typing import List, Optional, Any
 from datetime import datetime
+from applicants.models import ParseStatus
 
 class ApplicantCreate(BaseModel):
     name: str
     email: str
 
-class Applicant(BaseModel):
+class ApplicantSummary(BaseModel):
+    """The columns the applicant table view shows"""
     id: int
-    user_id: int
+    user_id: Optional[int]
     name: str
     email: str
-    resume_text: Optional[str]
-    skills: Optional[List[str]]
     phone: Optional[str]
+    skills: Optional[List[str]]
+    total_experience: Optional[float]
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class ApplicantDetail(ApplicantSummary):
+    resume_text: Optional[str]
     education: Optional[List[Any]]
     experience: Optional[List[Any]]
     company_names: Optional[List[str]]
     designations: Optional[List[str]]
     degrees: Optional[List[str]]
     college_names: Optional[List[str]]
-    total_experience: Optional[float]
-    created_at: Optional[datetime] = None
+
+SUMMARY_FIELDS = list(ApplicantSummary.model_fields)
+DETAIL_FIELDS = list(ApplicantDetail.model_fields)
+
+class ResumeParseJob(BaseModel):
+    id: str
+    applicant_id: Optional[int]
+    status: ParseStatus
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
+
+class BulkIngestFailure(BaseModel):
+    file: str
+    error: str
+
+class BulkIngestReport(BaseModel):
+    total_files: int
+    created: int
+    cached: int
+    failed: List[BulkIngestFailure]
+    applicant_ids: List[int]
+    elapsed_seconds: float
+    files_per_second: float
@@ -0,0 +1,293 @@
+import json
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from core.config import settings
+
+# Canonical skill name -> aliases. Matching is case-insensitive and whole-term,
+# so short names like "R" or "Go" no longer match inside other words. Words of
+# SHORT_TERM_MAX_CHARS letters or fewer ("Go", "R", "AI") are everyday words or
+# abbreviations, so they only match with the casing written here.
+DEFAULT_SKILLS: Dict[str, List[str]] = {
+    # Programming languages
+    "Python": ["python3"],
+    "Java": [],
+    "JavaScript": ["JS", "ecmascript", "es6"],
+    "TypeScript": [],
+    "C++": ["cpp", "cplusplus"],
+    "C#": ["csharp", "c sharp"],
+    "PHP": [],
+    "Ruby": [],
+    "Go": ["golang", "go language", "go lang"],
+    "Rust": [],
+    "Swift": [],
+    "Kotlin": [],
+    "Scala": [],
+    "R": [],
+    "MATLAB": [],
+    "SQL": [],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "Perl": [],
+    "Haskell": [],
+    "Elixir": [],
+    "Erlang": [],
+    "Clojure": [],
+    "Dart": [],
+    "Lua": [],
+    "Julia": [],
+    "Objective-C": ["objective c", "objc"],
+    "Shell Scripting": ["bash", "zsh", "powershell", "shell scripting"],
+    "Groovy": [],
+    "Fortran": [],
+    "COBOL": [],
+    "Assembly": [],
+    "Solidity": [],
+    "VBA": [],
+
+    # Frameworks and libraries
+    "React": ["react.js", "reactjs"],
+    "React Native": [],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue": ["vue.js", "vuejs"],
+    "Svelte": [],
+    "Next.js": ["nextjs"],
+    "Nuxt.js": ["nuxt", "nuxtjs"],
+    "Node.js": ["nodejs"],
+    "Express": ["express.js", "expressjs"],
+    "NestJS": ["nest.js"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Spring": ["spring boot", "springboot"],
+    "Hibernate": [],
+    "Laravel": [],
+    "Symfony": [],
+    "Ruby on Rails": ["rails", "ror"],
+    "ASP.NET": ["asp.net core"],
+    ".NET": ["dotnet", ".net core"],
+    "Bootstrap": [],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "jQuery": [],
+    "Redux": [],
+    "GraphQL": [],
+    "TensorFlow": [],
+    "PyTorch": ["torch"],
+    "Keras": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "Pandas": [],
+    "NumPy": [],
+    "SciPy": [],
+    "Matplotlib": [],
+    "OpenCV": [],
+    "Hugging Face": ["huggingface", "transformers"],
+    "spaCy": [],
+    "NLTK": [],
+    "Apache Spark": ["spark", "pyspark"],
+    "Hadoop": [],
+    "Kafka": ["apache kafka"],
+    "Airflow": ["apache airflow"],
+    "Flutter": [],
+    "Electron": [],
+    "Unity": [],
+    "Selenium": [],
+    "Cypress": [],
+    "Jest": [],
+    "Pytest": [],
+    "JUnit": [],
+    "Celery": [],
+    "RabbitMQ": [],
+    "gRPC": [],
+    "Webpack": [],
+
+    # Databases
+    "MySQL": [],
+    "PostgreSQL": ["postgres", "psql"],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "SQLite": [],
+    "Oracle": ["oracle db"],
+    "SQL Server": ["mssql", "ms sql server", "microsoft sql server"],
+    "MariaDB": [],
+    "Cassandra": [],
+    "DynamoDB": [],
+    "Elasticsearch": ["elastic search", "opensearch"],
+    "Neo4j": [],
+    "Firebase": ["firestore"],
+    "Snowflake": [],
+    "BigQuery": [],
+    "Redshift": [],
+    "SQLAlchemy": [],
+
+    # Tools and technologies
+    "Git": [],
+    "GitHub": [],
+    "GitLab": [],
+    "Bitbucket": [],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Helm": [],
+    "Terraform": [],
+    "Ansible": [],
+    "Puppet": [],
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Heroku": [],
+    "Jenkins": [],
+    "GitHub Actions": [],
+    "CircleCI": [],
+    "Travis CI": [],
+    "Linux": ["unix", "ubuntu", "centos", "debian"],
+    "Windows": [],
+    "Nginx": [],
+    "Apache": [],
+    "Jira": [],
+    "Confluence": [],
+    "Agile": [],
+    "Scrum": [],
+    "Kanban": [],
+    "CI/CD": ["ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "DevOps": [],
+    "MLOps": [],
+    "Microservices": ["microservice"],
+    "REST API": ["rest apis", "restful", "restful api", "restful apis"],
+    "Serverless": ["aws lambda"],
+    "Prometheus": [],
+    "Grafana": [],
+    "Postman": [],
+    "Figma": [],
+    "Tableau": [],
+    "Power BI": ["powerbi"],
+    "Microsoft Excel": ["ms excel", "advanced excel"],
+
+    # Practices and domains
+    "Machine Learning": ["ML"],
+    "Deep Learning": [],
+    "Artificial Intelligence": ["AI"],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": [],
+    "Data Analysis": ["data analytics"],
+    "Data Science": [],
+    "Data Engineering": [],
+    "ETL": [],
+    "Statistics": [],
+    "Big Data": [],
+    "Cloud Computing": [],
+    "Cybersecurity": ["cyber security", "information security", "infosec"],
+    "Networking": [],
+    "System Design": [],
+    "Object-Oriented Programming": ["oop", "object oriented programming"],
+    "Test-Driven Development": ["tdd", "test driven development"],
+    "Unit Testing": [],
+    "UI/UX": ["ui ux", "user experience", "ux design", "ui design"],
+
+    # Soft skills
+    "Leadership": [],
+    "Communication": [],
+    "Teamwork": ["team work"],
+    "Problem Solving": ["problem-solving"],
+    "Project Management": [],
+    "Analytical": ["analytical skills"],
+    "Creative": ["creativity"],
+    "Adaptable": ["adaptability"],
+    "Detail Oriented": ["detail-oriented", "attention to detail"],
+    "Time Management": [],
+    "Critical Thinking": [],
+    "Mentoring": [],
+}
+
+# Characters that continue a skill term; a match may not be preceded or followed by one
+_TERM_CHARS = r"[\w+#]"
+
+SHORT_TERM_MAX_CHARS = 2
+# Short terms are not matched when joined by these to other text either ("R&D", "go-to", "R's")
+_SHORT_TERM_CHARS = r"[\w+#&'’-]"
+# Short terms that are also everyday English words: "Go to the park" is not a skill, "Go, Rust" is
+_WORD_TERMS = {"Go"}
+
+def load_skill_dictionary(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Default skills merged with the JSON dictionary at `path` (canonical name -> aliases)"""
+    dictionary = {canonical: list(aliases) for canonical, aliases in DEFAULT_SKILLS.items()}
+    if path:
+        with open(path, encoding="utf-8") as handle:
+            for canonical, aliases in json.load(handle).items():
+                dictionary.setdefault(canonical, []).extend(aliases or [])
+    return dictionary
+
+def _trie_pattern(trie: dict) -> str:
+    """Turn a character trie into a regex where shared prefixes are matched once"""
+    terminal = "" in trie
+    branches = []
+    for char in sorted(key for key in trie if key):
+        token = r"\s+" if char == " " else re.escape(char)
+        branches.append(token + _trie_pattern(trie[char]))
+
+    if not branches:
+        return ""
+    if terminal:
+        # Greedy optional: prefer the longer term, fall back to the shorter one
+        return "(?:" + "|".join(branches) + ")?"
+    return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+class SkillExtractor:
+    """
+    Finds dictionary skills in text with one case-insensitive regex for
+    ordinary terms and one case-sensitive regex for short, ambiguous ones
+    """
+
+    def __init__(self, dictionary: Dict[str, List[str]]):
+        self.canonical: Dict[str, str] = {}
+        self.short_canonical: Dict[str, str] = {}
+        for canonical, aliases in dictionary.items():
+            for term in [canonical, *aliases]:
+                key = self._normalize(term)
+                if len(key) <= SHORT_TERM_MAX_CHARS and key.isalpha():
+                    self.short_canonical.setdefault(term.strip(), canonical)
+                elif key:
+                    self.canonical.setdefault(key, canonical)
+
+        trie: dict = {}
+        for term in self.canonical:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        self.pattern = re.compile(
+            rf"(?<!{_TERM_CHARS})({_trie_pattern(trie)})(?!{_TERM_CHARS})",
+            re.IGNORECASE
+        )
+        short_terms = [
+            re.escape(term) + (r"(?!\s+[a-z])" if term in _WORD_TERMS else "")
+            for term in sorted(self.short_canonical, key=len, reverse=True)
+        ]
+        self.short_pattern = re.compile(
+            rf"(?<!{_SHORT_TERM_CHARS})({'|'.join(short_terms)})(?!{_SHORT_TERM_CHARS})"
+        ) if short_terms else None
+
+    @staticmethod
+    def _normalize(term: str) -> str:
+        return " ".join(term.lower().split())
+
+    def extract(self, text: str) -> List[str]:
+        """Canonical names of the skills found in text, in order of first appearance"""
+        text = text or ""
+        hits = []
+        for match in self.pattern.finditer(text):
+            canonical = self.canonical.get(self._normalize(match.group(1)))
+            if canonical:
+                hits.append((match.start(), canonical))
+        if self.short_pattern is not None:
+            hits.extend((match.start(), self.short_canonical[match.group(1)]) for match in self.short_pattern.finditer(text))
+
+        found: Dict[str, None] = {}
+        for _, canonical in sorted(hits):
+            found.setdefault(canonical, None)
+        return list(found)
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    """Process-wide extractor, compiled once per worker"""
+    return SkillExtractor(load_skill_dictionary(settings.SKILL_DICTIONARY_PATH))
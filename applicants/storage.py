@@ -0,0 +1,28 @@
+import hashlib
+import os
+import uuid
+from typing import Tuple
+
+from core.config import settings
+
+def resume_digest(resume_bytes: bytes) -> str:
+    """SHA-256 of the resume bytes, used as its content address"""
+    return hashlib.sha256(resume_bytes).hexdigest()
+
+def store_resume(resume_bytes: bytes) -> Tuple[str, str]:
+    """
+    Store a resume PDF once under its content hash
+    Returns: (sha256, path)
+    """
+    digest = resume_digest(resume_bytes)
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    resume_path = os.path.join(settings.UPLOAD_DIR, f"{digest}.pdf")
+
+    # Identical uploads share one file; write via rename so concurrent uploads never see a partial file
+    if not os.path.exists(resume_path):
+        temp_path = f"{resume_path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as buffer:
+            buffer.write(resume_bytes)
+        os.replace(temp_path, resume_path)
+
+    return digest, resume_path
@@ -0,0 +1,139 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+import os
+import socket
+import threading
+import uuid
+
+from core.config import settings
+from core.workers import BoundedProcessPool, QueueFullError
+from database import SessionLocal
+from applicants import crud
+from applicants.parser import parse_resume, load_resume_models, parser_version
+from applicants.storage import resume_digest
+
+resume_parse_pool = BoundedProcessPool(
+    "resume parser",
+    max_workers=settings.RESUME_PARSE_WORKERS,
+    max_pending=settings.RESUME_PARSE_QUEUE_SIZE,
+    initializer=load_resume_models
+)
+
+# Bulk uploads get their own workers so a large archive cannot starve single registrations
+bulk_parse_pool = BoundedProcessPool(
+    "bulk resume parser",
+    max_workers=settings.BULK_INGEST_WORKERS,
+    max_pending=settings.BULK_INGEST_QUEUE_SIZE,
+    initializer=load_resume_models
+)
+
+# Names this process as the owner of the parse jobs it accepts
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Results are written back on a single thread so the pool's result handler never waits on the database
+_result_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resume-parse-writer")
+
+def preferred_identity(parsed_data: dict, name: str, email: str) -> Tuple[str, str]:
+    """Use parsed name and email if not provided or if parsed data is better"""
+    return parsed_data.get('name') or name, parsed_data.get('email') or email
+
+def submit_resume_parse(job_id: str, applicant_id: int, resume_sha256: str, resume_path: str,
+                        name: str, email: str) -> Future:
+    """Parse a stored resume in the worker pool and fill in the applicant when done. Raises QueueFullError."""
+    # Workers read the stored file themselves rather than receiving the bytes over the pipe
+    future = resume_parse_pool.submit(parse_resume, resume_path=resume_path)
+    future.add_done_callback(
+        lambda done: _result_writer.submit(
+            _store_parse_result, job_id, applicant_id, done, resume_sha256, resume_path, name, email
+        )
+    )
+    return future
+
+def _store_parse_result(job_id: str, applicant_id: int, future: Future, resume_sha256: str, resume_path: str,
+                        name: str, email: str) -> None:
+    db = SessionLocal()
+    try:
+        try:
+            resume_text, skills, parsed_data = future.result()
+        except Exception as e:
+            crud.finish_parse_job(db, job_id, error=f"Error processing resume: {str(e)}")
+            return
+
+        # Cache the result so identical uploads skip parsing
+        crud.save_parsed_resume(db, resume_sha256, parser_version(), resume_path, resume_text, skills, parsed_data)
+
+        parsed_name, parsed_email = preferred_identity(parsed_data, name, email)
+        applicant = crud.update_applicant_resume(
+            db,
+            applicant_id=applicant_id,
+            resume_text=resume_text,
+            skills=skills,
+            parsed_data=parsed_data,
+            name=parsed_name,
+            email=parsed_email
+        )
+        crud.finish_parse_job(db, job_id, error=None if applicant else "Applicant profile no longer exists")
+    except Exception as e:
+        db.rollback()
+        crud.finish_parse_job(db, job_id, error=f"Error saving parsed resume: {str(e)}")
+    finally:
+        db.close()
+
+def resume_interrupted_parses() -> int:
+    """
+    Take over the parse jobs whose owning process is gone (no heartbeat for
+    PARSE_JOB_STALE_SECONDS) and queue them again, failing those whose resume
+    is gone or that no longer fit in the queue. Jobs still owned by a live
+    process are left alone. Returns the number queued.
+    """
+    db = SessionLocal()
+    queued = 0
+    stale_before = datetime.utcnow() - timedelta(seconds=settings.PARSE_JOB_STALE_SECONDS)
+    try:
+        for job in crud.get_orphaned_parse_jobs(db, stale_before):
+            # Another process restarting at the same time may have claimed it first
+            if not crud.claim_parse_job(db, job.id, WORKER_ID, stale_before):
+                continue
+            applicant = job.applicant
+            if applicant is None or not applicant.resume_path or not os.path.exists(applicant.resume_path):
+                crud.finish_parse_job(db, job.id, error="Interrupted by a restart and the resume is no longer available")
+                continue
+            with open(applicant.resume_path, "rb") as resume:
+                resume_sha256 = resume_digest(resume.read())
+            try:
+                submit_resume_parse(job.id, applicant.id, resume_sha256, applicant.resume_path,
+                                    name=applicant.name, email=applicant.email)
+                queued += 1
+            except QueueFullError:
+                crud.finish_parse_job(db, job.id, error="Interrupted by a restart and the parsing queue is full")
+    finally:
+        db.close()
+    return queued
+
+_heartbeat_stop = threading.Event()
+_heartbeat_thread: Optional[threading.Thread] = None
+
+def _send_heartbeats() -> None:
+    while not _heartbeat_stop.wait(settings.PARSE_JOB_HEARTBEAT_SECONDS):
+        db = SessionLocal()
+        try:
+            crud.touch_parse_jobs(db, WORKER_ID)
+        except Exception as e:
+            db.rollback()
+            print(f"Warning: could not refresh resume parse heartbeats: {e}")
+        finally:
+            db.close()
+
+def start_heartbeat() -> None:
+    """Keep this process's parse jobs from being taken over while it is alive"""
+    global _heartbeat_thread
+    if _heartbeat_thread is None:
+        _heartbeat_thread = threading.Thread(target=_send_heartbeats, name="resume-parse-heartbeat", daemon=True)
+        _heartbeat_thread.start()
+
+def shutdown() -> None:
+    _heartbeat_stop.set()
+    resume_parse_pool.shutdown()
+    bulk_parse_pool.shutdown()
+    _result_writer.shutdown()
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.config import settings
+from auth.models import User, UserRole
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """The authenticated user as seen by request handlers, detached from any session"""
+    id: int
+    username: str
+    email: str
+    role: UserRole
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            role=user.role,
+            is_active=bool(user.is_active)
+        )
+
+class PrincipalCache:
+    """
+    In-process TTL + LRU cache of user principals keyed by token subject.
+    Entries are dropped on update through auth.crud; other processes see
+    changes once their copy expires.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max(0, max_size)
+        self._entries: "OrderedDict[str, Tuple[float, UserPrincipal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, username: str) -> Optional[UserPrincipal]:
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[username]
+                return None
+            self._entries.move_to_end(username)
+            return principal
+
+    def set(self, principal: UserPrincipal) -> None:
+        if self.max_size == 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[principal.username] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(principal.username)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, username: str) -> None:
+        with self._lock:
+            self._entries.pop(username, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+principal_cache = PrincipalCache(settings.USER_CACHE_TTL_SECONDS, settings.USER_CACHE_MAX_SIZE)
@@ -1,7 +1,10 @@
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from auth import models, schemas
-from bcrypt import hashpw, gensalt, checkpw
+from auth.cache import principal_cache
+from auth.hashing import verify_password
+from typing import Optional
 
 def get_user(db: Session, user_id: int):
     return db.query(models.User).filter(models.User.id == user_id).first()
@@ -12,8 +15,7 @@ def get_user_by_username(db: Session, username: str):
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
-def create_user(db: Session, user: schemas.UserCreate):
-    hashed_password = hashpw(user.password.encode('utf-8'), gensalt()).decode('utf-8')
+def create_user(db: Session, user: schemas.UserCreate, hashed_password: str):
     db_user = models.User(
         username=user.username,
         email=user.email,
@@ -25,10 +27,28 @@ def create_user(db: Session, user: schemas.UserCreate):
     db.refresh(db_user)
     return db_user
 
-def authenticate_user(db: Session, username: str, password: str):
-    user = get_user_by_username(db, username)
+def update_user(db: Session, user_id: int, email: Optional[str] = None, role: Optional[models.UserRole] = None, is_active: Optional[bool] = None):
+    db_user = get_user(db, user_id)
+    if db_user:
+        if email is not None:
+            db_user.email = email
+        if role is not None:
+            db_user.role = role
+        if is_active is not None:
+            db_user.is_active = is_active
+        db.commit()
+        db.refresh(db_user)
+        principal_cache.invalidate(db_user.username)
+    return db_user
+
+def deactivate_user(db: Session, user_id: int):
+    return update_user(db, user_id, is_active=False)
+
+async def authenticate_user(db: Session, username: str, password: str):
+    """Called from async endpoints, so the lookup runs in the threadpool"""
+    user = await run_in_threadpool(get_user_by_username, db, username)
     if not user:
         return False
-    if not checkpw(password.encode('utf-8'), user.hashed_password.encode('utf-8')):
+    if not await verify_password(password, user.hashed_password):
         return False
     return user
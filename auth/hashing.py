@@ -0,0 +1,31 @@
+import asyncio
+
+from bcrypt import hashpw, gensalt, checkpw
+
+from core.config import settings
+from core.workers import BoundedProcessPool
+
+# bcrypt is deliberately slow; run it in its own small pool so a login storm
+# queues here instead of tying up the threads that serve every other endpoint
+password_pool = BoundedProcessPool(
+    "password hashing",
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_QUEUE_SIZE
+)
+
+def _hash_password(password: str, rounds: int) -> str:
+    return hashpw(password.encode('utf-8'), gensalt(rounds)).decode('utf-8')
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    return checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+async def hash_password(password: str) -> str:
+    """Hash a password with the configured bcrypt cost. Raises QueueFullError."""
+    return await asyncio.wrap_future(password_pool.submit(_hash_password, password, settings.BCRYPT_ROUNDS))
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """Check a password against its bcrypt hash. Raises QueueFullError."""
+    return await asyncio.wrap_future(password_pool.submit(_verify_password, password, hashed_password))
+
+def shutdown() -> None:
+    password_pool.shutdown()
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi import APIRouter, Depends, HTTPException, Form
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
@@ -7,7 +8,9 @@ from datetime import datetime, timedelta
 from database import get_db
 from core.config import settings
 from auth import schemas, crud
-from auth.models import User
+from auth.cache import UserPrincipal, principal_cache
+from auth.hashing import hash_password
+from core.workers import QueueFullError
 
 router = APIRouter()
 security = HTTPBearer()
@@ -19,7 +22,7 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)) -> UserPrincipal:
     try:
         # Remove quotes if present in token
         token = credentials.credentials.strip('"')
@@ -30,39 +33,71 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
 
-    user = crud.get_user_by_username(db, username=username)
-    if user is None:
-        raise HTTPException(status_code=401, detail="User not found")
-    return user
+    # Routine requests are served from the cache without a user query
+    principal = principal_cache.get(username)
+    if principal is None:
+        user = crud.get_user_by_username(db, username=username)
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        principal = UserPrincipal.from_user(user)
+        principal_cache.set(principal)
+
+    if not principal.is_active:
+        raise HTTPException(status_code=401, detail="Inactive user")
+    # Tokens issued before a role change are no longer valid
+    role = payload.get("role")
+    if role is not None and role != principal.role.value:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+    return principal
 
 def require_role(role: str):
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(current_user: UserPrincipal = Depends(get_current_user)):
         if current_user.role.value != role:
             raise HTTPException(status_code=403, detail="Operation not permitted")
         return current_user
     return role_checker
 
+def password_queue_full() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Too many sign-in requests, please try again shortly",
+        headers={"Retry-After": "5"}
+    )
+
 @router.post("/register", response_model=schemas.User)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Register a new user (company or applicant)"""
-    db_user = crud.get_user_by_username(db, username=user.username)
+    # Database calls go to the threadpool so they never block the event loop
+    db_user = await run_in_threadpool(crud.get_user_by_username, db, username=user.username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
     
-    db_user_email = crud.get_user_by_email(db, email=user.email)
+    db_user_email = await run_in_threadpool(crud.get_user_by_email, db, email=user.email)
     if db_user_email:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    return crud.create_user(db=db, user=user)
+    try:
+        hashed_password = await hash_password(user.password)
+    except QueueFullError:
+        raise password_queue_full()
+    
+    return await run_in_threadpool(crud.create_user, db=db, user=user, hashed_password=hashed_password)
 
 @router.post("/token", response_model=schemas.Token)
-def login_for_access_token(username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
+async def login_for_access_token(username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
     """Login user and return access token"""
-    authenticated_user = crud.authenticate_user(db, username, password)
+    try:
+        authenticated_user = await crud.authenticate_user(db, username, password)
+    except QueueFullError:
+        raise password_queue_full()
     if not authenticated_user:
         raise HTTPException(status_code=401, detail="Incorrect username or password")
 
-    access_token = create_access_token(data={"sub": authenticated_user.username})
+    principal_cache.set(UserPrincipal.from_user(authenticated_user))
+    access_token = create_access_token(data={
+        "sub": authenticated_user.username,
+        "role": authenticated_user.role.value
+    })
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -74,6 +109,6 @@ def login_for_access_token(username: str = Form(...), password: str = Form(...),
     }
 
 @router.get("/me", response_model=schemas.User)
-def read_users_me(current_user: User = Depends(get_current_user)):
+def read_users_me(current_user: UserPrincipal = Depends(get_current_user)):
     """Get current user information"""
     return current_user
\ No newline at end of file
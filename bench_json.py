@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Benchmark against a throwaway database, never the real one
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from typing import List
+
+import main
+from database import SessionLocal
+from core.responses import ORJSON_AVAILABLE
+from auth.models import User, UserRole
+from auth.router import create_access_token
+from applicants import crud as applicants_crud
+from applicants.schemas import ApplicantSummary, SUMMARY_FIELDS
+from jobs import crud as jobs_crud
+from jobs.schemas import JobPositionCreate
+from matching.schemas import JobCandidates
+from matching.utils import get_matched_applicants_for_job
+
+SKILLS = ["Python", "SQL", "Docker", "React", "AWS", "Kubernetes", "Go", "Java"]
+
+def seed(applicants: int) -> int:
+    db = SessionLocal()
+    try:
+        company = User(username="bench", email="bench@example.com", hashed_password="-", role=UserRole.company)
+        db.add(company)
+        db.commit()
+        entries = [{
+            "name": f"Applicant {i}",
+            "email": f"applicant{i}@example.com",
+            "resume_text": "Experienced engineer. " * 200,
+            "skills": SKILLS[i % 4:i % 4 + 4],
+            "parsed_data": {"education": ["BSc Computer Science"], "experience": ["Engineer at Example"] * 5},
+            "resume_path": None
+        } for i in range(applicants)]
+        for start in range(0, len(entries), 500):
+            applicants_crud.create_applicants_bulk(db, entries[start:start + 500])
+        job = jobs_crud.create_job(db, JobPositionCreate(title="Engineer", description="Build things", skills=SKILLS), company_id=company.id)
+        return job.id
+    finally:
+        db.close()
+
+def timed(fn, repeat: int) -> float:
+    """Median milliseconds of `repeat` calls"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def compare(label: str, adapter: TypeAdapter, data, repeat: int) -> None:
+    """Old path (validate, jsonable_encoder, json.dumps) against one pydantic-core dump"""
+    legacy = timed(lambda: json.dumps(jsonable_encoder(adapter.validate_python(data, from_attributes=True))), repeat)
+    direct = timed(lambda: adapter.dump_json(adapter.validate_python(data, from_attributes=True)), repeat)
+    print(f"{label:42s} {legacy:9.2f} ms {direct:9.2f} ms {legacy / direct:6.1f}x")
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization of the largest list responses")
+    parser.add_argument("--applicants", type=int, default=2000, help="Applicants to seed")
+    parser.add_argument("--limit", type=int, default=500, help="Page size to request")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement")
+    args = parser.parse_args()
+
+    job_id = seed(args.applicants)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench', 'role': 'company'})}"}
+    client = TestClient(main.app)
+
+    print(f"orjson available: {ORJSON_AVAILABLE}\n")
+    print(f"{'Endpoint (median of %d)' % args.repeat:42s} {'latency':>12s} {'bytes':>10s}")
+    for url in [f"/applicants/?limit={args.limit}", f"/matching/jobs/{job_id}/candidates?limit={args.limit}"]:
+        size = len(client.get(url, headers=headers).content)
+        latency = timed(lambda: client.get(url, headers=headers), args.repeat)
+        print(f"{url:42s} {latency:9.2f} ms {size:10d}")
+
+    print(f"\n{'Serialization only':42s} {'before':>12s} {'after':>12s} {'gain':>7s}")
+    db = SessionLocal()
+    try:
+        applicants = applicants_crud.get_applicants(db, limit=args.limit, fields=SUMMARY_FIELDS)
+        compare("/applicants/", TypeAdapter(List[ApplicantSummary]), applicants, args.repeat)
+
+        matches, total = get_matched_applicants_for_job(db, job_id, limit=args.limit)
+        candidates = {
+            "job_id": job_id,
+            "job_title": "Engineer",
+            "total_candidates": total,
+            "candidates": [{
+                "applicant_id": match["applicant"].id,
+                "name": match["applicant"].name,
+                "email": match["applicant"].email,
+                "match_percentage": match["match_percentage"],
+                "matched_skills": match["matched_skills"]
+            } for match in matches]
+        }
+        compare("/matching/jobs/{id}/candidates", TypeAdapter(JobCandidates), candidates, args.repeat)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main_benchmark()
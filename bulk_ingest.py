@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import SessionLocal, engine, Base
+from core.config import settings
+from core.workers import BoundedProcessPool
+from auth.models import User
+from jobs.models import JobPosition
+from applicants.models import Applicant, ParsedResume
+from interviews.models import Interview
+from offers.models import OfferLetter
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
+from applicants.bulk import iter_resume_sources, ingest_resumes
+from applicants.parser import load_resume_models
+
+def main():
+    parser = argparse.ArgumentParser(description="Create applicants from a directory or zip of resume PDFs")
+    parser.add_argument("path", help="Directory (searched recursively) or .zip file of PDF resumes")
+    parser.add_argument("--workers", type=int, default=settings.BULK_INGEST_WORKERS, help="Parser processes")
+    parser.add_argument("--batch-size", type=int, default=settings.BULK_INGEST_BATCH_SIZE, help="Applicants per transaction")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"❌ {args.path} does not exist")
+        sys.exit(1)
+
+    Base.metadata.create_all(bind=engine)
+    pool = BoundedProcessPool(
+        "bulk resume parser",
+        max_workers=args.workers,
+        max_pending=args.workers * 4,
+        initializer=load_resume_models
+    )
+    db = SessionLocal()
+    try:
+        report = ingest_resumes(db, iter_resume_sources(args.path), pool=pool, batch_size=args.batch_size)
+    finally:
+        db.close()
+        pool.shutdown()
+
+    print(f"✅ Processed {report['total_files']} files in {report['elapsed_seconds']}s "
+          f"({report['files_per_second']} files/s)")
+    print(f"  - {report['created']} applicants created")
+    print(f"  - {report['cached']} resumes reused from cache")
+    print(f"  - {len(report['failed'])} failed")
+    for failure in report['failed']:
+        print(f"❌ {failure['file']}: {failure['error']}")
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,70 @@
-
 import os
 from typing import Optional
 
 class Settings:
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production-123456789")
+    SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./recruitment_tracker.db")
+    # Derived from DATABASE_URL (aiosqlite / asyncpg) unless set
+    ASYNC_DATABASE_URL: Optional[str] = os.getenv("ASYNC_DATABASE_URL")
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "./uploads")
     OFFER_LETTERS_DIR: str = os.getenv("OFFER_LETTERS_DIR", "./offer_letters")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-settings = Settings()
-import os
-from typing import Optional
+    # Password hashing
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "64"))
 
-class Settings:
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
-    ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Authenticated-user cache
+    USER_CACHE_TTL_SECONDS: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+    USER_CACHE_MAX_SIZE: int = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
+    # Database connection pools, applied to both the sync and async engines
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+    # Report the number of SQL statements per request in an X-Query-Count header
+    QUERY_COUNT_HEADER: bool = os.getenv("QUERY_COUNT_HEADER", "false").lower() in ("1", "true", "yes")
+
+    # SQLite tuning: WAL journal, pragmas on connect and a single in-process writer
+    SQLITE_TUNING: bool = os.getenv("SQLITE_TUNING", "true").lower() in ("1", "true", "yes")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+    # Background resume parsing
+    RESUME_PARSE_WORKERS: int = int(os.getenv("RESUME_PARSE_WORKERS", str(os.cpu_count() or 2)))
+    RESUME_PARSE_QUEUE_SIZE: int = int(os.getenv("RESUME_PARSE_QUEUE_SIZE", "100"))
+    # Each process refreshes the jobs it owns this often; jobs not refreshed for the stale time are taken over
+    PARSE_JOB_HEARTBEAT_SECONDS: float = float(os.getenv("PARSE_JOB_HEARTBEAT_SECONDS", "30"))
+    PARSE_JOB_STALE_SECONDS: float = float(os.getenv("PARSE_JOB_STALE_SECONDS", "120"))
+
+    # Background offer letter rendering
+    OFFER_RENDER_WORKERS: int = int(os.getenv("OFFER_RENDER_WORKERS", str(os.cpu_count() or 2)))
+    OFFER_RENDER_QUEUE_SIZE: int = int(os.getenv("OFFER_RENDER_QUEUE_SIZE", "1000"))
+    OFFER_BATCH_MAX_SIZE: int = int(os.getenv("OFFER_BATCH_MAX_SIZE", "500"))
+
+    # Offer PDFs are rendered on first download and kept in a size-bounded LRU disk cache
+    OFFER_CACHE_DIR: str = os.getenv("OFFER_CACHE_DIR", os.path.join(OFFER_LETTERS_DIR, "cache"))
+    OFFER_CACHE_MAX_BYTES: int = int(os.getenv("OFFER_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+    # Bulk resume ingestion
+    BULK_INGEST_WORKERS: int = int(os.getenv("BULK_INGEST_WORKERS", str(os.cpu_count() or 2)))
+    BULK_INGEST_BATCH_SIZE: int = int(os.getenv("BULK_INGEST_BATCH_SIZE", "200"))
+    # Parses queued or running across all bulk uploads; an upload gets 503 when it cannot start
+    BULK_INGEST_QUEUE_SIZE: int = int(os.getenv("BULK_INGEST_QUEUE_SIZE", str(BULK_INGEST_WORKERS * 8)))
+
+    # Resume text extraction budgets
+    RESUME_MAX_BYTES: int = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+    RESUME_MAX_PAGES: int = int(os.getenv("RESUME_MAX_PAGES", "20"))
+    RESUME_EXTRACT_SECONDS: float = float(os.getenv("RESUME_EXTRACT_SECONDS", "15"))
+    RESUME_MAX_TEXT_CHARS: int = int(os.getenv("RESUME_MAX_TEXT_CHARS", "100000"))
+
+    # Optional JSON file of extra skills for resume parsing: {"Canonical Name": ["alias", ...]}
+    SKILL_DICTIONARY_PATH: Optional[str] = os.getenv("SKILL_DICTIONARY_PATH")
 
 settings = Settings()
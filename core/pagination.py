@@ -0,0 +1,49 @@
+import base64
+import json
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, Response
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Encode a position in a result ordering as an opaque, URL-safe cursor"""
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a cursor produced by encode_cursor; None means the first page"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(position, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return position
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode the id position of a list cursor; None means the first page"""
+    after = decode_cursor(cursor)
+    if after is None:
+        return None
+    if not isinstance(after.get("id"), int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after["id"]
+
+def keyset_by_id(query, id_column, after_id: Optional[int], limit: int):
+    """Rows of `query` in id order after `after_id`; an index seek, so deep pages cost the same"""
+    if after_id is not None:
+        query = query.filter(id_column > after_id)
+    return query.order_by(id_column).limit(limit).all()
+
+def page_by_id(rows: List[Any], limit: int, response: Response) -> List[Any]:
+    """
+    Trim a list query to one page and put the cursor of the next page in the
+    X-Next-Cursor header. Queries fetch limit + 1 rows in id order; the extra
+    row only tells whether another page exists.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor({"id": rows[-1].id})
+    return rows
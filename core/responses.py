@@ -0,0 +1,121 @@
+import json
+import re
+from typing import Any, BinaryIO, Callable, Iterator, Mapping, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+# Try to import orjson, fallback to the standard library encoder if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when it is installed. Datetimes and other
+    values orjson understands may be passed as-is, without jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=to_jsonable_python
+        ).encode("utf-8")
+
+def model_response(adapter: TypeAdapter, data: Any, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Validate `data` (ORM objects or dicts) against the response type once and
+    dump it straight to JSON bytes with pydantic-core. Returning this skips
+    FastAPI's second validation and jsonable_encoder pass over response_model.
+    """
+    content = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    return Response(content=content, media_type="application/json", headers=dict(headers or {}))
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    The inclusive (start, end) of a single `bytes=` range, or None when the
+    header asks for something else (several ranges) and the whole body should be sent.
+    Raises ValueError when the range cannot be satisfied.
+    """
+    match = _RANGE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+def _iter_file(fileobj: BinaryIO, start: int, length: int, chunk_size: int) -> Iterator[bytes]:
+    try:
+        fileobj.seek(start)
+        while length > 0:
+            chunk = fileobj.read(min(chunk_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        fileobj.close()
+
+def stream_response(
+    request: Request,
+    opener: Callable[[], BinaryIO],
+    size: int,
+    etag: str,
+    media_type: str,
+    filename: Optional[str] = None,
+    chunk_size: int = 64 * 1024
+) -> Response:
+    """
+    Stream a file with ETag revalidation and single byte-range support.
+    `size` and `etag` come from the caller so serving needs no stat, and
+    `opener` is only called when a body is sent; the file it returns is always closed.
+    """
+    headers = {"ETag": f'"{etag}"', "Accept-Ranges": "bytes", "Cache-Control": "private, no-cache"}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    # If-Range: only honour the range if the client's copy is still current
+    if range_header and request.headers.get("if-range", headers["ETag"]) == headers["ETag"]:
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if byte_range is None:
+        start, length, status_code = 0, size, 200
+    else:
+        start, end = byte_range
+        length, status_code = end - start + 1, 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(length)
+
+    return StreamingResponse(
+        _iter_file(opener(), start, length, chunk_size),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers
+    )
@@ -0,0 +1,85 @@
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional
+
+class QueueFullError(Exception):
+    """Raised when a worker pool already has its maximum number of pending tasks"""
+
+class BoundedProcessPool:
+    """
+    Process pool with a hard cap on queued + running tasks.
+    Submissions beyond the cap are rejected immediately so callers can push
+    back on clients instead of letting the backlog grow without bound.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_pending: int, initializer: Optional[Callable] = None):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "restarts": 0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Start worker processes lazily, on first use
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer
+                )
+            return self._executor
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        # A worker died and the executor refuses all further work; drop it so a fresh one starts
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+                self._counters["restarts"] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        return self._get_executor()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _on_done(self, future: Future) -> None:
+        self._slots.release()
+        self._count("failed" if future.cancelled() or future.exception() else "completed")
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) in a worker process, or raise QueueFullError"""
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise QueueFullError(f"{self.name} queue is full")
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                future = self._replace_executor(executor).submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        self._count("submitted")
+        future.add_done_callback(self._on_done)
+        return future
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counters = dict(self._counters)
+        counters["pending"] = counters["submitted"] - counters["completed"] - counters["failed"]
+        counters["max_pending"] = self.max_pending
+        counters["workers"] = self.max_workers
+        return counters
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,23 +1,167 @@
 
-from sqlalchemy import create_engine
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-import os
+from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from core.config import settings
+
+DATABASE_URL = settings.DATABASE_URL
+
+def pool_options(url: str) -> dict:
+    """Explicit pool sizing from settings; in-memory SQLite keeps its single-connection pool"""
+    if make_url(url).get_backend_name() == "sqlite" and not is_file_sqlite(url):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING
+    }
+
+def is_file_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    WAL lets readers run alongside the writer on their own connections;
+    synchronous=NORMAL is durable across application crashes in WAL mode.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+class WriterTimeoutError(TimeoutError):
+    """Raised when a write waited longer than the busy timeout for the SQLite writer"""
+
+class SQLiteWriter:
+    """
+    Serializes write transactions in this process. SQLite allows one writer
+    at a time; queueing writers here instead of inside SQLite avoids
+    "database is locked" errors when a busy timeout runs out.
+    A session takes the writer slot on its first flush or bulk UPDATE/DELETE
+    and gives it back when its transaction ends.
+    """
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+
+    def acquire(self, session) -> None:
+        if session.info.get("sqlite_writer"):
+            return
+        if not self._lock.acquire(timeout=self.timeout_seconds):
+            raise WriterTimeoutError("Timed out waiting for the SQLite writer")
+        session.info["sqlite_writer"] = True
+
+    def release(self, session) -> None:
+        if session.info.pop("sqlite_writer", False):
+            self._lock.release()
+
+    def install(self, session_factory) -> None:
+        @event.listens_for(session_factory, "before_flush")
+        def before_flush(session, flush_context, instances):
+            if session.new or session.dirty or session.deleted:
+                self.acquire(session)
+
+        @event.listens_for(session_factory, "do_orm_execute")
+        def before_bulk_write(orm_execute_state):
+            if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+                self.acquire(orm_execute_state.session)
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./recruitment_tracker.db")
+        @event.listens_for(session_factory, "after_transaction_end")
+        def after_transaction_end(session, transaction):
+            if transaction.parent is None:
+                self.release(session)
 
+def async_database_url(url: str) -> str:
+    """The same database addressed through its asyncio driver"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    if backend == "postgresql":
+        return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    return url
+
+sync_pool_options = pool_options(DATABASE_URL)
 engine = create_engine(
-    DATABASE_URL, 
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    DATABASE_URL,
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **({"poolclass": QueuePool, **sync_pool_options} if sync_pool_options else {})
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+SQLITE_TUNED = settings.SQLITE_TUNING and is_file_sqlite(DATABASE_URL)
+sqlite_writer = SQLiteWriter(settings.SQLITE_BUSY_TIMEOUT_MS / 1000)
+if SQLITE_TUNED:
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    sqlite_writer.install(SessionLocal)
+
 Base = declarative_base()
 
+class ThreadpoolSession:
+    """Stand-in for AsyncSession.run_sync that runs a sync Session in the threadpool"""
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    async def close(self):
+        await run_in_threadpool(self.sync_session.close)
+
+# Try to set up the asyncio engine, fallback to the threadpool if its driver is not installed
+try:
+    import greenlet  # noqa: F401  required by SQLAlchemy's asyncio extension
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or async_database_url(DATABASE_URL)
+    async_pool_options = pool_options(ASYNC_DATABASE_URL)
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        **({"poolclass": AsyncAdaptedQueuePool, **async_pool_options} if async_pool_options else {})
+    )
+    if SQLITE_TUNED:
+        # Async sessions are read-only today; they share the pragmas but not the writer slot
+        event.listen(async_engine.sync_engine, "connect", apply_sqlite_pragmas)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    ASYNC_DB_AVAILABLE = True
+except ImportError:
+    AsyncSession = ThreadpoolSession
+    async_engine = None
+    AsyncSessionLocal = None
+    ASYNC_DB_AVAILABLE = False
+    print("Warning: async database driver not available, async endpoints will use the threadpool")
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """
+    Session for async endpoints. Call crud functions through
+    `await db.run_sync(crud_fn, ...)`; they run on the event loop when an
+    async driver is installed and in the threadpool otherwise.
+    """
+    db = AsyncSessionLocal() if ASYNC_DB_AVAILABLE else ThreadpoolSession(SessionLocal())
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -0,0 +1,105 @@
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event
+
+from database import SessionLocal, engine
+from auth.models import User
+from jobs.models import JobPosition
+from applicants.models import Applicant, ResumeParseJob, ParsedResume
+from interviews.models import Interview
+from offers.models import OfferLetter
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
+from auth import crud as auth_crud
+from jobs import crud as jobs_crud
+from applicants import crud as applicants_crud
+from interviews import crud as interviews_crud
+from offers import crud as offers_crud
+from matching.utils import get_matched_applicants_for_job, get_matched_jobs_for_applicant
+
+# (label, call, full scan expected) for the queries the routers run.
+# Unfiltered listings walk the primary key on purpose; anything else that scans needs an index.
+QUERIES = [
+    ("auth: user by username", lambda db: auth_crud.get_user_by_username(db, "advisor"), False),
+    ("auth: user by email", lambda db: auth_crud.get_user_by_email(db, "advisor@example.com"), False),
+    ("jobs: list", lambda db: jobs_crud.get_jobs(db, after_id=1), True),
+    ("jobs: by id", lambda db: jobs_crud.get_job(db, 1), False),
+    ("applicants: list", lambda db: applicants_crud.get_applicants(db, after_id=1), True),
+    ("applicants: by id", lambda db: applicants_crud.get_applicant(db, 1), False),
+    ("applicants: by user", lambda db: applicants_crud.get_applicant_by_user_id(db, 1), False),
+    ("applicants: parse job", lambda db: applicants_crud.get_parse_job(db, "advisor"), False),
+    ("applicants: parsed resume", lambda db: applicants_crud.get_parsed_resume(db, "advisor", "advisor"), False),
+    ("interviews: with position", lambda db: interviews_crud.get_interview_with_position(db, 1), False),
+    ("interviews: by company", lambda db: interviews_crud.get_interviews_by_company(db, 1, after_id=1), False),
+    ("interviews: by applicant user", lambda db: interviews_crud.get_interviews_by_applicant_user(db, 1, after_id=1), False),
+    ("offers: with owners", lambda db: offers_crud.get_offer_with_owners(db, 1), False),
+    ("offers: render data", lambda db: offers_crud.get_offer_render_data(db, 1), False),
+    ("offers: by company", lambda db: offers_crud.get_offers_by_company(db, 1, after_id=1), False),
+    ("offers: by applicant user", lambda db: offers_crud.get_offers_by_applicant_user(db, 1, after_id=1), False),
+    ("matching: candidates for job", lambda db: get_matched_applicants_for_job(db, 1, limit=50), False),
+    ("matching: jobs for applicant", lambda db: get_matched_jobs_for_applicant(db, 1, limit=50), False),
+]
+
+def capture_statements(call):
+    """Run one crud call and return the (statement, parameters) it sent to the database"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    db = SessionLocal()
+    try:
+        call(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        db.close()
+    return [(statement, parameters) for statement, parameters in statements
+            if statement.lstrip().upper().startswith("SELECT")]
+
+def explain(statement, parameters):
+    """Query plan lines and the ones that read a whole table or index"""
+    sqlite = engine.dialect.name == "sqlite"
+    prefix = "EXPLAIN QUERY PLAN " if sqlite else "EXPLAIN "
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+    if sqlite:
+        lines = [row[-1] for row in rows]
+        scans = [line for line in lines if line.startswith("SCAN ")]
+    else:
+        lines = [row[0] for row in rows]
+        scans = [line for line in lines if "Seq Scan" in line]
+    return lines, scans
+
+def run_advisor() -> int:
+    flagged = 0
+    for label, call, scan_expected in QUERIES:
+        try:
+            statements = capture_statements(call)
+        except Exception as e:
+            print(f"❌ {label}: {e}")
+            flagged += 1
+            continue
+
+        for statement, parameters in statements:
+            lines, scans = explain(statement, parameters)
+            if scans and not scan_expected:
+                flagged += 1
+                print(f"❌ {label}: full scan")
+                print("    " + " ".join(statement.split()))
+                for line in lines:
+                    print(f"    {line}")
+            else:
+                print(f"✅ {label}: {'; '.join(lines)}")
+
+    if flagged:
+        print(f"\n❌ {flagged} queries need an index")
+    else:
+        print("\n✅ Every query is served by an index")
+    return 1 if flagged else 0
+
+if __name__ == "__main__":
+    sys.exit(run_advisor())
@@ -12,9 +12,10 @@ from database import engine, Base
 # Import all models to ensure they're registered with SQLAlchemy
 from auth.models import User, UserRole
 from jobs.models import JobPosition
-from applicants.models import Applicant
+from applicants.models import Applicant, ResumeParseJob, ParsedResume
 from interviews.models import Interview, InterviewStatus
 from offers.models import OfferLetter
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
 
 def init_database():
     """Initialize the database with all tables"""
@@ -1,7 +1,10 @@
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from interviews.models import Interview
+from jobs.models import JobPosition
 from interviews.schemas import InterviewCreate, InterviewUpdate
+from core.pagination import keyset_by_id
+from typing import Optional
 
 def create_interview(db: Session, interview: InterviewCreate):
     from datetime import datetime
@@ -16,14 +19,20 @@ def create_interview(db: Session, interview: InterviewCreate):
     db.refresh(db_interview)
     return db_interview
 
-def get_interviews(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Interview).offset(skip).limit(limit).all()
+def get_interviews(db: Session, limit: int = 100, after_id: Optional[int] = None):
+    return keyset_by_id(db.query(Interview), Interview.id, after_id, limit)
 
 def get_interview(db: Session, interview_id: int):
     return db.query(Interview).filter(Interview.id == interview_id).first()
 
+def get_interview_with_position(db: Session, interview_id: int):
+    """Interview with the owning company of its position, in one query"""
+    return db.query(Interview).options(
+        joinedload(Interview.position).load_only(JobPosition.id, JobPosition.company_id)
+    ).filter(Interview.id == interview_id).first()
+
 def update_interview(db: Session, interview_id: int, interview_update: InterviewUpdate):
-    db_interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    db_interview = db.get(Interview, interview_id)
     if db_interview:
         update_data = interview_update.dict(exclude_unset=True)
         for field, value in update_data.items():
@@ -32,12 +41,21 @@ def update_interview(db: Session, interview_id: int, interview_update: Interview
         db.refresh(db_interview)
     return db_interview
 
-def get_interviews_by_company(db: Session, company_id: int):
-    from jobs.models import JobPosition
-    return db.query(Interview).join(JobPosition, Interview.position_id == JobPosition.id).filter(JobPosition.company_id == company_id).all()
+def get_interviews_by_company(db: Session, company_id: int, limit: int = 100, after_id: Optional[int] = None):
+    """Interviews for the company's own positions, skipping interviews without an applicant"""
+    query = db.query(Interview).join(JobPosition, Interview.position_id == JobPosition.id).filter(
+        JobPosition.company_id == company_id,
+        Interview.applicant_id.isnot(None)
+    )
+    return keyset_by_id(query, Interview.id, after_id, limit)
+
+def get_interviews_by_applicant_user(db: Session, user_id: int, limit: int = 100, after_id: Optional[int] = None):
+    from applicants.models import Applicant
+    query = db.query(Interview).join(Applicant, Interview.applicant_id == Applicant.id).filter(Applicant.user_id == user_id)
+    return keyset_by_id(query, Interview.id, after_id, limit)
 
 def delete_interview(db: Session, interview_id: int):
-    db_interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    db_interview = db.get(Interview, interview_id)
     if db_interview:
         db.delete(db_interview)
         db.commit()
@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -15,13 +15,18 @@ class Interview(Base):
     __tablename__ = "interviews"
 
     id = Column(Integer, primary_key=True, index=True)
-    applicant_id = Column(Integer, ForeignKey("applicants.id"))
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), index=True)
     position_id = Column(Integer, ForeignKey("jobs.id"))
     date_time = Column(DateTime)
     status = Column(Enum(InterviewStatus), default=InterviewStatus.scheduled)
     notes = Column(String, nullable=True)
     created_at = Column(DateTime, default=func.now(), nullable=True)
     
+    __table_args__ = (
+        # Company-scoped listing: interviews of a position in id order
+        Index("ix_interviews_position_id_id", "position_id", "id"),
+    )
+    
     # Relationships
     applicant = relationship("Applicant", back_populates="interviews")
     position = relationship("JobPosition", back_populates="interviews", lazy="select")
@@ -1,13 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from database import get_db
+from database import get_db, get_async_db, AsyncSession
+from core.pagination import decode_id_cursor, page_by_id
 from auth.router import get_current_user, require_role
-from auth.models import User
-from applicants.models import Applicant
+from auth.cache import UserPrincipal
 from interviews import schemas, crud
-from interviews.models import Interview
 from jobs.crud import get_job
 from applicants.crud import get_applicant
 
@@ -16,7 +15,7 @@ router = APIRouter()
 @router.post("/", response_model=schemas.Interview)
 def schedule_interview(
     interview: schemas.InterviewCreate,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
     """Schedule an interview"""
@@ -33,42 +32,42 @@ def schedule_interview(
     return crud.create_interview(db=db, interview=interview)
 
 @router.get("/", response_model=List[schemas.Interview])
-def list_interviews(
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def list_interviews(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List interviews"""
+    """List interviews; the next page's cursor is in the X-Next-Cursor header"""
+    after_id = decode_id_cursor(cursor)
     if current_user.role.value == "company":
-        # Companies see interviews for their job positions - filter out null applicant_id
-        interviews = crud.get_interviews_by_company(db, company_id=current_user.id)
-        return [interview for interview in interviews if interview.applicant_id is not None]
+        # Companies see interviews for their job positions
+        interviews = await db.run_sync(
+            crud.get_interviews_by_company, company_id=current_user.id, limit=limit + 1, after_id=after_id
+        )
+        return page_by_id(interviews, limit, response)
     else:
         # Applicants see their own interviews
-        applicant = db.query(Applicant).filter(Applicant.user_id == current_user.id).first()
-        if not applicant:
-            return []
-        return db.query(Interview).filter(
-            Interview.applicant_id == applicant.id,
-            Interview.applicant_id.isnot(None)
-        ).all()
+        interviews = await db.run_sync(
+            crud.get_interviews_by_applicant_user, user_id=current_user.id, limit=limit + 1, after_id=after_id
+        )
+        return page_by_id(interviews, limit, response)
 
 @router.put("/{interview_id}", response_model=schemas.Interview)
 def update_interview(
     interview_id: int,
     interview_update: schemas.InterviewUpdate,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
     """Update interview status or time"""
-    interview = crud.get_interview(db, interview_id=interview_id)
+    interview = crud.get_interview_with_position(db, interview_id=interview_id)
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
 
     # Verify the interview belongs to a job owned by this company
-    job = get_job(db, job_id=interview.position_id)
-    if not job or job.company_id != current_user.id:
+    if not interview.position or interview.position.company_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to update this interview")
 
     return crud.update_interview(db=db, interview_id=interview_id, interview_update=interview_update)
@@ -76,17 +75,16 @@ def update_interview(
 @router.delete("/{interview_id}")
 def delete_interview(
     interview_id: int,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
     """Delete an interview"""
-    interview = crud.get_interview(db, interview_id=interview_id)
+    interview = crud.get_interview_with_position(db, interview_id=interview_id)
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
 
     # Verify the interview belongs to a job owned by this company
-    job = get_job(db, job_id=interview.position_id)
-    if not job or job.company_id != current_user.id:
+    if not interview.position or interview.position.company_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this interview")
 
     return crud.delete_interview(db=db, interview_id=interview_id)
\ No newline at end of file
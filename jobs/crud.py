@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
+from typing import Optional
+from core.pagination import keyset_by_id
 from jobs.models import JobPosition
 from jobs import schemas
+from matching.crud import index_job_skills, refresh_job_scores, remove_job_from_index, remove_job_scores
 
 def create_job(db: Session, job: schemas.JobPositionCreate, company_id: int):
     db_job = JobPosition(
@@ -12,18 +15,22 @@ def create_job(db: Session, job: schemas.JobPositionCreate, company_id: int):
         company_id=company_id
     )
     db.add(db_job)
+    db.flush()
+    index_job_skills(db, db_job)
+    refresh_job_scores(db, db_job)
     db.commit()
     db.refresh(db_job)
     return db_job
 
-def get_jobs(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(JobPosition).offset(skip).limit(limit).all()
+def get_jobs(db: Session, limit: int = 100, after_id: Optional[int] = None):
+    return keyset_by_id(db.query(JobPosition), JobPosition.id, after_id, limit)
 
 def get_job(db: Session, job_id: int):
     return db.query(JobPosition).filter(JobPosition.id == job_id).first()
 
 def update_job(db: Session, job_id: int, job_update: schemas.JobPositionUpdate):
-    db_job = db.query(JobPosition).filter(JobPosition.id == job_id).first()
+    # Routers already loaded the job for the ownership check; reuse it from the session
+    db_job = db.get(JobPosition, job_id)
     if db_job:
         if job_update.title is not None:
             db_job.title = job_update.title
@@ -31,6 +38,8 @@ def update_job(db: Session, job_id: int, job_update: schemas.JobPositionUpdate):
             db_job.description = job_update.description
         if job_update.skills is not None:
             db_job.skills = job_update.skills
+            index_job_skills(db, db_job)
+            refresh_job_scores(db, db_job)
         if job_update.salary is not None:
             db_job.salary = job_update.salary
         if job_update.location is not None:
@@ -40,8 +49,10 @@ def update_job(db: Session, job_id: int, job_update: schemas.JobPositionUpdate):
     return db_job
 
 def delete_job(db: Session, job_id: int):
-    db_job = db.query(JobPosition).filter(JobPosition.id == job_id).first()
+    db_job = db.get(JobPosition, job_id)
     if db_job:
+        remove_job_from_index(db, job_id)
+        remove_job_scores(db, job_id)
         db.delete(db_job)
         db.commit()
     return db_job
\ No newline at end of file
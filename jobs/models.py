@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, Float, JSON, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, JSON, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -16,6 +16,11 @@ class JobPosition(Base):
     company_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime, default=func.now())
     
+    __table_args__ = (
+        # Company-scoped listings join through the company's jobs
+        Index("ix_jobs_company_id_id", "company_id", "id"),
+    )
+    
     # Relationships
     company = relationship("User", back_populates="jobs")
     interviews = relationship("Interview", back_populates="position")
@@ -1,28 +1,40 @@
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from pydantic import TypeAdapter
 
-from database import get_db
-from auth.router import get_current_user, require_role
-from auth.models import User
+from database import get_db, get_async_db, AsyncSession
+from core.pagination import decode_id_cursor, page_by_id
+from core.responses import model_response
+from auth.router import require_role
+from auth.cache import UserPrincipal
 from jobs import schemas, crud
 
 router = APIRouter()
 
+job_list_adapter = TypeAdapter(List[schemas.JobPosition])
+
 @router.post("/", response_model=schemas.JobPosition)
 def create_job(
     job: schemas.JobPositionCreate,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
     """Create new job posting (HR only)"""
     return crud.create_job(db=db, job=job, company_id=current_user.id)
 
 @router.get("/", response_model=List[schemas.JobPosition])
-def list_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all job postings"""
-    return crud.get_jobs(db, skip=skip, limit=limit)
+async def list_jobs(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List all job postings; the next page's cursor is in the X-Next-Cursor header"""
+    after_id = decode_id_cursor(cursor)
+    jobs = await db.run_sync(crud.get_jobs, limit=limit + 1, after_id=after_id)
+    return model_response(job_list_adapter, page_by_id(jobs, limit, response), headers=response.headers)
 
 @router.get("/{job_id}", response_model=schemas.JobPosition)
 def get_job(job_id: int, db: Session = Depends(get_db)):
@@ -36,7 +48,7 @@ def get_job(job_id: int, db: Session = Depends(get_db)):
 def update_job(
     job_id: int,
     job_update: schemas.JobPositionUpdate,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
     """Update job posting (HR only)"""
@@ -50,7 +62,7 @@ def update_job(
 @router.delete("/{job_id}")
 def delete_job(
     job_id: int,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
     """Delete job posting (HR only)"""
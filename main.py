@@ -1,15 +1,24 @@
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
 import os
 import uvicorn
 
-from database import engine, Base
-from auth.router import router as auth_router
+from database import engine, async_engine, Base, WriterTimeoutError
+from core.config import settings
+from core.query_count import QueryCountMiddleware, count_queries
+from core.responses import FastJSONResponse
+from auth.router import router as auth_router, require_role
+from auth.cache import UserPrincipal
 from jobs.router import router as jobs_router
 from applicants.router import router as applicants_router
+from applicants import worker as resume_worker
+from offers import worker as offer_worker
+from auth import hashing as password_hashing
 from matching.router import router as matching_router
 from interviews.router import router as interviews_router
 from offers.router import router as offers_router
@@ -20,9 +29,10 @@ os.makedirs("offer_letters", exist_ok=True)
 
 # Import all models to ensure they're registered
 from auth.models import User, UserRole
-from applicants.models import Applicant
+from applicants.models import Applicant, ResumeParseJob, ParsedResume
 from interviews.models import Interview, InterviewStatus
 from offers.models import OfferLetter
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
 
 # Create database tables
 try:
@@ -31,10 +41,27 @@ try:
 except Exception as e:
     print(f"Error creating database tables: {e}")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parses owned by processes that have stopped were lost with their worker pools
+    resume_worker.start_heartbeat()
+    requeued = await run_in_threadpool(resume_worker.resume_interrupted_parses)
+    if requeued:
+        print(f"Re-queued {requeued} interrupted resume parses")
+    yield
+    # Stop background worker pools
+    resume_worker.shutdown()
+    offer_worker.shutdown()
+    password_hashing.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
 app = FastAPI(
     title="Recruitment Tracker System",
     description="A complete hiring management system with job postings, resume uploads, skill matching, interview scheduling, and offer letter generation.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -43,10 +70,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-# Mount static files for offer letters and UI
-app.mount("/offer_letters", StaticFiles(directory="offer_letters"), name="offer_letters")
+if settings.QUERY_COUNT_HEADER:
+    count_queries(engine)
+    if async_engine is not None:
+        count_queries(async_engine.sync_engine)
+    app.add_middleware(QueryCountMiddleware)
+
+@app.exception_handler(WriterTimeoutError)
+async def writer_timeout_handler(request: Request, exc: WriterTimeoutError):
+    # Writes are queueing behind each other; ask the client to come back rather than failing hard
+    return FastJSONResponse(
+        status_code=503,
+        content={"detail": "The database is busy, please try again shortly"},
+        headers={"Retry-After": "5"}
+    )
+
+# Mount static files for the UI; offer letters are only served through the authenticated /offers/{id}
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Serve CSS and JS files at root level for easier access
@@ -74,5 +116,16 @@ async def root():
 async def api_root():
     return {"message": "Welcome to Recruitment Tracker System", "docs": "/docs"}
 
+@app.get("/api/metrics")
+async def worker_metrics(current_user: UserPrincipal = Depends(require_role("company"))):
+    """Queue depth and task counters of the background worker pools (company only)"""
+    return {
+        "resume_parsing": resume_worker.resume_parse_pool.stats(),
+        "bulk_resume_parsing": resume_worker.bulk_parse_pool.stats(),
+        "offer_rendering": offer_worker.offer_render_pool.stats(),
+        "offer_pdf_cache": offer_worker.offer_pdf_cache.stats(),
+        "password_hashing": password_hashing.password_pool.stats()
+    }
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=5000, reload=True)
@@ -0,0 +1,154 @@
+from sqlalchemy.orm import Session
+from typing import Iterable, Set
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
+
+def normalize_skill(skill) -> str:
+    """Normalize a skill name for case-insensitive matching"""
+    return str(skill).strip().lower()
+
+def normalize_skills(skills: Iterable) -> Set[str]:
+    return {normalize_skill(skill) for skill in (skills or []) if normalize_skill(skill)}
+
+def index_applicant_skills(db: Session, applicant) -> None:
+    """Replace the skill index rows for an applicant (caller commits)"""
+    db.query(ApplicantSkill).filter(ApplicantSkill.applicant_id == applicant.id).delete(synchronize_session=False)
+    db.add_all([
+        ApplicantSkill(skill=skill, applicant_id=applicant.id)
+        for skill in normalize_skills(applicant.skills)
+    ])
+
+def index_job_skills(db: Session, job) -> None:
+    """Replace the skill index rows for a job (caller commits)"""
+    db.query(JobSkill).filter(JobSkill.job_id == job.id).delete(synchronize_session=False)
+    db.add_all([
+        JobSkill(skill=skill, job_id=job.id)
+        for skill in normalize_skills(job.skills)
+    ])
+
+def remove_applicant_from_index(db: Session, applicant_id: int) -> None:
+    db.query(ApplicantSkill).filter(ApplicantSkill.applicant_id == applicant_id).delete(synchronize_session=False)
+
+def remove_job_from_index(db: Session, job_id: int) -> None:
+    db.query(JobSkill).filter(JobSkill.job_id == job_id).delete(synchronize_session=False)
+
+def refresh_applicant_scores(db: Session, applicant) -> None:
+    """Recompute the materialized scores of one applicant against every job (caller commits)"""
+    from jobs.models import JobPosition
+    from matching.scorer import score_applicant_against_jobs
+
+    remove_applicant_scores(db, applicant.id)
+    if not applicant.skills:
+        return
+
+    jobs = db.query(JobPosition.id, JobPosition.skills).filter(
+        JobPosition.id.in_(job_ids_with_any_skill(db, applicant.skills))
+    ).all()
+    scores = score_applicant_against_jobs(applicant.skills, [skills for _, skills in jobs])
+    db.add_all([
+        JobApplicantScore(job_id=job_id, applicant_id=applicant.id, score=score, matched_skills=matched_skills)
+        for (job_id, _), (score, matched_skills) in zip(jobs, scores)
+        if score > 0
+    ])
+
+def index_new_applicants(db: Session, applicants) -> None:
+    """Skill index rows for just-inserted applicants, which have no rows to replace (caller commits)"""
+    db.add_all([
+        ApplicantSkill(skill=skill, applicant_id=applicant.id)
+        for applicant in applicants
+        for skill in normalize_skills(applicant.skills)
+    ])
+
+def score_new_applicants(db: Session, applicants) -> None:
+    """Materialized scores for just-inserted applicants, loading the candidate jobs once for the batch (caller commits)"""
+    from jobs.models import JobPosition
+    from matching.scorer import score_applicant_against_jobs
+
+    applicants = [applicant for applicant in applicants if applicant.skills]
+    if not applicants:
+        return
+
+    batch_skills = {skill for applicant in applicants for skill in applicant.skills}
+    jobs = db.query(JobPosition.id, JobPosition.skills).filter(
+        JobPosition.id.in_(job_ids_with_any_skill(db, batch_skills))
+    ).all()
+    job_skill_lists = [skills for _, skills in jobs]
+    for applicant in applicants:
+        scores = score_applicant_against_jobs(applicant.skills, job_skill_lists)
+        db.add_all([
+            JobApplicantScore(job_id=job_id, applicant_id=applicant.id, score=score, matched_skills=matched_skills)
+            for (job_id, _), (score, matched_skills) in zip(jobs, scores)
+            if score > 0
+        ])
+
+def refresh_job_scores(db: Session, job) -> None:
+    """Recompute the materialized scores of one job against every applicant (caller commits)"""
+    from applicants.models import Applicant
+    from matching.scorer import score_job_against_applicants
+
+    remove_job_scores(db, job.id)
+    if not job.skills:
+        return
+
+    applicants = db.query(Applicant.id, Applicant.skills).filter(
+        Applicant.id.in_(applicant_ids_with_any_skill(db, job.skills))
+    ).all()
+    scores = score_job_against_applicants(job.skills, [skills for _, skills in applicants])
+    db.add_all([
+        JobApplicantScore(job_id=job.id, applicant_id=applicant_id, score=score, matched_skills=matched_skills)
+        for (applicant_id, _), (score, matched_skills) in zip(applicants, scores)
+        if score > 0
+    ])
+
+def remove_applicant_scores(db: Session, applicant_id: int) -> None:
+    db.query(JobApplicantScore).filter(JobApplicantScore.applicant_id == applicant_id).delete(synchronize_session=False)
+
+def remove_job_scores(db: Session, job_id: int) -> None:
+    db.query(JobApplicantScore).filter(JobApplicantScore.job_id == job_id).delete(synchronize_session=False)
+
+def applicant_ids_with_any_skill(db: Session, skills: Iterable):
+    """Subquery of applicant ids sharing at least one of the given skills"""
+    return db.query(ApplicantSkill.applicant_id).filter(
+        ApplicantSkill.skill.in_(normalize_skills(skills))
+    ).distinct()
+
+def job_ids_with_any_skill(db: Session, skills: Iterable):
+    """Subquery of job ids requiring at least one of the given skills"""
+    return db.query(JobSkill.job_id).filter(
+        JobSkill.skill.in_(normalize_skills(skills))
+    ).distinct()
+
+def rebuild_skill_index(db: Session) -> dict:
+    """Rebuild the whole skill index from the applicants and jobs tables"""
+    from applicants.models import Applicant
+    from jobs.models import JobPosition
+
+    db.query(ApplicantSkill).delete(synchronize_session=False)
+    db.query(JobSkill).delete(synchronize_session=False)
+
+    applicant_rows = 0
+    for applicant_id, skills in db.query(Applicant.id, Applicant.skills).yield_per(1000):
+        rows = [ApplicantSkill(skill=skill, applicant_id=applicant_id) for skill in normalize_skills(skills)]
+        db.add_all(rows)
+        applicant_rows += len(rows)
+
+    job_rows = 0
+    for job_id, skills in db.query(JobPosition.id, JobPosition.skills).yield_per(1000):
+        rows = [JobSkill(skill=skill, job_id=job_id) for skill in normalize_skills(skills)]
+        db.add_all(rows)
+        job_rows += len(rows)
+
+    db.commit()
+    return {"applicant_skills": applicant_rows, "job_skills": job_rows}
+
+def rebuild_match_scores(db: Session) -> int:
+    """Recompute every materialized match score from the skill index"""
+    from jobs.models import JobPosition
+
+    db.query(JobApplicantScore).delete(synchronize_session=False)
+
+    jobs = db.query(JobPosition).filter(JobPosition.skills.isnot(None)).all()
+    for job in jobs:
+        refresh_job_scores(db, job)
+        db.commit()
+
+    return db.query(JobApplicantScore).count()
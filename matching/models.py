@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, Float, JSON, ForeignKey, Index
+from database import Base
+
+class ApplicantSkill(Base):
+    """Inverted index row: one normalized skill held by one applicant"""
+    __tablename__ = "applicant_skills"
+
+    skill = Column(String, primary_key=True)
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), primary_key=True, index=True)
+
+class JobSkill(Base):
+    """Inverted index row: one normalized skill required by one job"""
+    __tablename__ = "job_skills"
+
+    skill = Column(String, primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True, index=True)
+
+class JobApplicantScore(Base):
+    """Materialized match score for a job/applicant pair sharing at least one skill"""
+    __tablename__ = "job_applicant_scores"
+
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), primary_key=True)
+    score = Column(Float, nullable=False)
+    matched_skills = Column(JSON, default=list)
+
+    __table_args__ = (
+        # Serve "best candidates for a job" and "best jobs for an applicant" as index range scans
+        Index("ix_job_applicant_scores_job_score", "job_id", score.desc(), "applicant_id"),
+        Index("ix_job_applicant_scores_applicant_score", "applicant_id", score.desc(), "job_id"),
+    )
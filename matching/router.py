@@ -1,33 +1,60 @@
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Any
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from pydantic import TypeAdapter
 
-from database import get_db
+from database import get_async_db, AsyncSession
+from core.pagination import encode_cursor, decode_cursor
+from core.responses import model_response
 from auth.router import get_current_user, require_role
-from auth.models import User
+from auth.cache import UserPrincipal
 from matching.utils import get_matched_applicants_for_job, get_matched_jobs_for_applicant
 from jobs.crud import get_job
 from applicants.crud import get_applicant
+from matching import schemas
 
 router = APIRouter()
 
-@router.get("/jobs/{job_id}/candidates")
-def get_candidates_for_job(
+job_candidates_adapter = TypeAdapter(schemas.JobCandidates)
+applicant_matches_adapter = TypeAdapter(schemas.ApplicantMatches)
+
+def decode_match_cursor(cursor: Optional[str]) -> Optional[dict]:
+    """Decode a (score, id) position produced by next_page_cursor"""
+    after = decode_cursor(cursor)
+    if after is None:
+        return None
+    if not isinstance(after.get("score"), (int, float)) or not isinstance(after.get("id"), int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after
+
+def next_page_cursor(page: List[dict], key: str, limit: int) -> Optional[str]:
+    """Cursor for the page after `page`, or None when this is the last page"""
+    if len(page) < limit:
+        return None
+    last = page[-1]
+    return encode_cursor({"score": last["match_percentage"], "id": last[key].id})
+
+@router.get("/jobs/{job_id}/candidates", response_model=schemas.JobCandidates)
+async def get_candidates_for_job(
     job_id: int,
     min_match_percentage: float = 0.0,
-    current_user: User = Depends(require_role("company")),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(require_role("company")),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get matched applicants for a specific job"""
-    job = get_job(db, job_id=job_id)
+    """Get the best matched applicants for a specific job, one page at a time"""
+    after = decode_match_cursor(cursor)
+    job = await db.run_sync(get_job, job_id=job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
     if job.company_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view candidates for this job")
     
-    matched_applicants = get_matched_applicants_for_job(db, job_id, min_match_percentage)
+    matched_applicants, total = await db.run_sync(
+        get_matched_applicants_for_job, job_id, min_match_percentage, limit=limit, after=after
+    )
     
     # Format response
     result = []
@@ -40,22 +67,26 @@ def get_candidates_for_job(
             "matched_skills": match["matched_skills"]
         })
     
-    return {
+    return model_response(job_candidates_adapter, {
         "job_id": job_id,
         "job_title": job.title,
-        "total_candidates": len(result),
-        "candidates": result
-    }
+        "total_candidates": total,
+        "candidates": result,
+        "next_cursor": next_page_cursor(matched_applicants, "applicant", limit)
+    })
 
-@router.get("/applicants/{applicant_id}/matches")
-def get_matches_for_applicant(
+@router.get("/applicants/{applicant_id}/matches", response_model=schemas.ApplicantMatches)
+async def get_matches_for_applicant(
     applicant_id: int,
     min_match_percentage: float = 0.0,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get matching jobs for a specific applicant"""
-    applicant = get_applicant(db, applicant_id=applicant_id)
+    """Get the best matching jobs for a specific applicant, one page at a time"""
+    after = decode_match_cursor(cursor)
+    applicant = await db.run_sync(get_applicant, applicant_id=applicant_id)
     if not applicant:
         raise HTTPException(status_code=404, detail="Applicant not found")
     
@@ -63,7 +94,9 @@ def get_matches_for_applicant(
     if current_user.role.value == "applicant" and applicant.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view matches for this applicant")
     
-    matched_jobs = get_matched_jobs_for_applicant(db, applicant_id, min_match_percentage)
+    matched_jobs, total = await db.run_sync(
+        get_matched_jobs_for_applicant, applicant_id, min_match_percentage, limit=limit, after=after
+    )
     
     # Format response
     result = []
@@ -77,9 +110,10 @@ def get_matches_for_applicant(
             "matched_skills": match["matched_skills"]
         })
     
-    return {
+    return model_response(applicant_matches_adapter, {
         "applicant_id": applicant_id,
         "applicant_name": applicant.name,
-        "total_matches": len(result),
-        "job_matches": result
-    }
+        "total_matches": total,
+        "job_matches": result,
+        "next_cursor": next_page_cursor(matched_jobs, "job", limit)
+    })
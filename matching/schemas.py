@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class CandidateMatch(BaseModel):
+    applicant_id: int
+    name: str
+    email: str
+    match_percentage: float
+    matched_skills: List[str]
+
+class JobCandidates(BaseModel):
+    job_id: int
+    job_title: str
+    total_candidates: int
+    candidates: List[CandidateMatch]
+    next_cursor: Optional[str] = None
+
+class JobMatch(BaseModel):
+    job_id: int
+    title: str
+    description: str
+    company_id: int
+    match_percentage: float
+    matched_skills: List[str]
+
+class ApplicantMatches(BaseModel):
+    applicant_id: int
+    applicant_name: str
+    total_matches: int
+    job_matches: List[JobMatch]
+    next_cursor: Optional[str] = None
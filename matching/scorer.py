@@ -0,0 +1,133 @@
+import threading
+from typing import List, Dict, Iterable, Sequence, Tuple
+
+from matching.crud import normalize_skill
+
+# Try to import numpy, fallback to pure Python scoring if not available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("Warning: numpy not available, using pure Python skill scoring")
+
+class SkillVocabulary:
+    """Maps normalized skill names to dense integer ids shared by jobs and applicants"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._skills: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def encode(self, skills: Iterable) -> List[int]:
+        """Return the unique ids for a skill list, registering unseen skills"""
+        ids = []
+        seen = set()
+        for skill in skills or []:
+            name = normalize_skill(skill)
+            skill_id = self._ids.get(name)
+            if skill_id is None:
+                with self._lock:
+                    skill_id = self._ids.get(name)
+                    if skill_id is None:
+                        skill_id = len(self._skills)
+                        self._skills.append(name)
+                        self._ids[name] = skill_id
+            if skill_id not in seen:
+                seen.add(skill_id)
+                ids.append(skill_id)
+        return ids
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        return [self._skills[skill_id] for skill_id in ids]
+
+class SkillMatrix:
+    """Sparse boolean rows x skills matrix stored in CSR form (indptr, indices)"""
+
+    def __init__(self, vocabulary: SkillVocabulary, skill_lists: Sequence[Iterable]):
+        self.vocabulary = vocabulary
+        self.n_rows = len(skill_lists)
+        # Denominators are the raw list length, duplicates included, as the original per-pair scoring had it
+        self.lengths = [len(skills) if skills else 0 for skills in skill_lists]
+        self.rows = [vocabulary.encode(skills) for skills in skill_lists]
+
+        if NUMPY_AVAILABLE:
+            sizes = np.fromiter((len(row) for row in self.rows), dtype=np.int64, count=self.n_rows)
+            self.indptr = np.zeros(self.n_rows + 1, dtype=np.int64)
+            np.cumsum(sizes, out=self.indptr[1:])
+            self.indices = np.fromiter(
+                (skill_id for row in self.rows for skill_id in row),
+                dtype=np.int64,
+                count=int(self.indptr[-1])
+            )
+            self.row_of = np.repeat(np.arange(self.n_rows, dtype=np.int64), sizes)
+
+    def intersect(self, target_ids: List[int]):
+        """Count and list the skills each row shares with the target id set"""
+        if not NUMPY_AVAILABLE:
+            target = set(target_ids)
+            matched = [[skill_id for skill_id in row if skill_id in target] for row in self.rows]
+            return [len(row) for row in matched], matched
+
+        hits = np.isin(self.indices, np.asarray(target_ids, dtype=np.int64))
+        counts = np.bincount(self.row_of[hits], minlength=self.n_rows)
+        # Split the hit ids back into per-row lists using the hit prefix sums
+        hit_positions = np.concatenate(([0], np.cumsum(hits)))[self.indptr]
+        matched_ids = self.indices[hits]
+        matched = [
+            matched_ids[hit_positions[row]:hit_positions[row + 1]].tolist()
+            for row in range(self.n_rows)
+        ]
+        return counts, matched
+
+def _round_percentages(counts, denominators):
+    if not NUMPY_AVAILABLE:
+        return [round((count / denominator) * 100, 2) if denominator else 0.0
+                for count, denominator in zip(counts, denominators)]
+
+    denominators = np.asarray(denominators, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = np.where(denominators > 0, counts / denominators * 100, 0.0)
+    return np.round(percentages, 2).tolist()
+
+_default_vocabulary = SkillVocabulary()
+
+def score_job_against_applicants(job_skills: List[str], applicant_skill_lists: Sequence[Iterable],
+                                 vocabulary: SkillVocabulary = None) -> List[Tuple[float, List[str]]]:
+    """
+    Score one job against N applicants in a single batch
+    Returns: [(match_percentage, matched_skills)] in applicant order
+    """
+    if not job_skills or not applicant_skill_lists:
+        return [(0.0, []) for _ in applicant_skill_lists]
+
+    vocabulary = vocabulary or _default_vocabulary
+    job_ids = vocabulary.encode(job_skills)
+    matrix = SkillMatrix(vocabulary, applicant_skill_lists)
+    counts, matched = matrix.intersect(job_ids)
+
+    percentages = _round_percentages(counts, [len(job_skills)] * matrix.n_rows)
+    return [
+        (percentage if matrix.lengths[row] else 0.0, vocabulary.decode(matched[row]))
+        for row, percentage in enumerate(percentages)
+    ]
+
+def score_applicant_against_jobs(applicant_skills: List[str], job_skill_lists: Sequence[Iterable],
+                                 vocabulary: SkillVocabulary = None) -> List[Tuple[float, List[str]]]:
+    """
+    Score one applicant against N jobs in a single batch
+    Returns: [(match_percentage, matched_skills)] in job order
+    """
+    if not applicant_skills or not job_skill_lists:
+        return [(0.0, []) for _ in job_skill_lists]
+
+    vocabulary = vocabulary or _default_vocabulary
+    applicant_ids = vocabulary.encode(applicant_skills)
+    matrix = SkillMatrix(vocabulary, job_skill_lists)
+    counts, matched = matrix.intersect(applicant_ids)
+
+    percentages = _round_percentages(counts, matrix.lengths)
+    return [(percentage, vocabulary.decode(matched[row])) for row, percentage in enumerate(percentages)]
@@ -1,69 +1,78 @@
-
-from typing import List, Dict, Tuple
-from sqlalchemy.orm import Session
+from typing import List, Dict, Tuple, Optional
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session, load_only
 from jobs.models import JobPosition
 from applicants.models import Applicant
+from matching.models import JobApplicantScore
 
-def calculate_skill_match_percentage(job_skills: List[str], applicant_skills: List[str]) -> float:
-    """Calculate match percentage based on skill overlap"""
-    if not job_skills or not applicant_skills:
-        return 0.0
-    
-    # Convert to lowercase for case-insensitive matching
-    job_skills_lower = [skill.lower() for skill in job_skills]
-    applicant_skills_lower = [skill.lower() for skill in applicant_skills]
-    
-    # Calculate intersection
-    matched_skills = set(job_skills_lower) & set(applicant_skills_lower)
-    
-    # Calculate percentage based on job requirements
-    match_percentage = (len(matched_skills) / len(job_skills_lower)) * 100
-    return round(match_percentage, 2)
+def page_after(query, other_id_column, after: Optional[Dict]):
+    """Restrict a score query to rows after a (score desc, id asc) keyset position"""
+    if after is None:
+        return query
+    score, last_id = float(after["score"]), int(after["id"])
+    return query.filter(or_(
+        JobApplicantScore.score < score,
+        and_(JobApplicantScore.score == score, other_id_column > last_id)
+    ))
 
-def get_matched_applicants_for_job(db: Session, job_id: int, min_match_percentage: float = 0.0) -> List[Dict]:
-    """Get matched applicants for a specific job"""
-    job = db.query(JobPosition).filter(JobPosition.id == job_id).first()
-    if not job:
-        return []
-    
-    applicants = db.query(Applicant).filter(Applicant.skills.isnot(None)).all()
-    matched_applicants = []
+def get_matched_applicants_for_job(db: Session, job_id: int, min_match_percentage: float = 0.0,
+                                   limit: Optional[int] = None, after: Optional[Dict] = None) -> Tuple[List[Dict], int]:
+    """
+    Get matched applicants for a specific job from the materialized scores
+    Returns: (one page of matches, total number of matches)
+    """
+    matches = db.query(JobApplicantScore).filter(
+        JobApplicantScore.job_id == job_id,
+        JobApplicantScore.score >= min_match_percentage
+    )
+    total = matches.count()
     
-    for applicant in applicants:
-        if applicant.skills:
-            match_percentage = calculate_skill_match_percentage(job.skills, applicant.skills)
-            if match_percentage >= min_match_percentage:
-                matched_applicants.append({
-                    "applicant": applicant,
-                    "match_percentage": match_percentage,
-                    "matched_skills": list(set([skill.lower() for skill in job.skills]) & 
-                                          set([skill.lower() for skill in applicant.skills]))
-                })
+    # Highest match percentage first, read straight off the (job_id, score) index
+    page = page_after(
+        db.query(JobApplicantScore, Applicant)
+        .join(Applicant, Applicant.id == JobApplicantScore.applicant_id)
+        .options(load_only(Applicant.id, Applicant.name, Applicant.email))
+        .filter(JobApplicantScore.job_id == job_id, JobApplicantScore.score >= min_match_percentage),
+        JobApplicantScore.applicant_id,
+        after
+    ).order_by(JobApplicantScore.score.desc(), JobApplicantScore.applicant_id).limit(limit).all()
     
-    # Sort by match percentage (highest first)
-    matched_applicants.sort(key=lambda x: x["match_percentage"], reverse=True)
-    return matched_applicants
+    return [
+        {
+            "applicant": applicant,
+            "match_percentage": score.score,
+            "matched_skills": score.matched_skills or []
+        }
+        for score, applicant in page
+    ], total
 
-def get_matched_jobs_for_applicant(db: Session, applicant_id: int, min_match_percentage: float = 0.0) -> List[Dict]:
-    """Get matching jobs for a specific applicant"""
-    applicant = db.query(Applicant).filter(Applicant.id == applicant_id).first()
-    if not applicant or not applicant.skills:
-        return []
-    
-    jobs = db.query(JobPosition).all()
-    matched_jobs = []
+def get_matched_jobs_for_applicant(db: Session, applicant_id: int, min_match_percentage: float = 0.0,
+                                   limit: Optional[int] = None, after: Optional[Dict] = None) -> Tuple[List[Dict], int]:
+    """
+    Get matching jobs for a specific applicant from the materialized scores
+    Returns: (one page of matches, total number of matches)
+    """
+    matches = db.query(JobApplicantScore).filter(
+        JobApplicantScore.applicant_id == applicant_id,
+        JobApplicantScore.score >= min_match_percentage
+    )
+    total = matches.count()
     
-    for job in jobs:
-        if job.skills:
-            match_percentage = calculate_skill_match_percentage(job.skills, applicant.skills)
-            if match_percentage >= min_match_percentage:
-                matched_jobs.append({
-                    "job": job,
-                    "match_percentage": match_percentage,
-                    "matched_skills": list(set([skill.lower() for skill in job.skills]) & 
-                                          set([skill.lower() for skill in applicant.skills]))
-                })
+    # Highest match percentage first, read straight off the (applicant_id, score) index
+    page = page_after(
+        db.query(JobApplicantScore, JobPosition)
+        .join(JobPosition, JobPosition.id == JobApplicantScore.job_id)
+        .options(load_only(JobPosition.id, JobPosition.title, JobPosition.description, JobPosition.company_id))
+        .filter(JobApplicantScore.applicant_id == applicant_id, JobApplicantScore.score >= min_match_percentage),
+        JobApplicantScore.job_id,
+        after
+    ).order_by(JobApplicantScore.score.desc(), JobApplicantScore.job_id).limit(limit).all()
     
-    # Sort by match percentage (highest first)
-    matched_jobs.sort(key=lambda x: x["match_percentage"], reverse=True)
-    return matched_jobs
+    return [
+        {
+            "job": job,
+            "match_percentage": score.score,
+            "matched_skills": score.matched_skills or []
+        }
+        for score, job in page
+    ], total
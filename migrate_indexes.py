@@ -0,0 +1,37 @@
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import inspect
+
+from database import engine, Base
+from auth.models import User
+from jobs.models import JobPosition
+from applicants.models import Applicant, ResumeParseJob, ParsedResume
+from interviews.models import Interview
+from offers.models import OfferLetter
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
+
+def migrate_indexes():
+    """Create indexes declared on the models that an existing database is missing"""
+    # create_all only adds indexes together with new tables
+    Base.metadata.create_all(bind=engine)
+
+    inspector = inspect(engine)
+    created = 0
+    try:
+        for table in Base.metadata.sorted_tables:
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(bind=engine)
+                    created += 1
+                    print(f"✅ Created index {index.name} on {table.name}")
+        print(f"✅ Index migration completed successfully ({created} created)")
+    except Exception as e:
+        print(f"❌ Error creating indexes: {e}")
+
+if __name__ == "__main__":
+    migrate_indexes()
@@ -33,6 +33,26 @@ def migrate_offers():
             cursor.execute("ALTER TABLE offers ADD COLUMN start_date TEXT")
             print("✅ Added start_date column to offers table")
         
+        # Company offer letter templates
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='offer_templates'")
+        if not cursor.fetchone():
+            cursor.execute("""
+                CREATE TABLE offer_templates (
+                    id INTEGER PRIMARY KEY,
+                    company_id INTEGER UNIQUE REFERENCES users(id),
+                    title TEXT,
+                    greeting TEXT,
+                    body TEXT,
+                    terms TEXT,
+                    closing TEXT,
+                    signature TEXT,
+                    updated_at DATETIME
+                )
+            """)
+            cursor.execute("CREATE INDEX ix_offer_templates_id ON offer_templates (id)")
+            cursor.execute("CREATE UNIQUE INDEX ix_offer_templates_company_id ON offer_templates (company_id)")
+            print("✅ Created offer_templates table")
+        
         conn.commit()
         print("✅ Offers table migration completed successfully")
         
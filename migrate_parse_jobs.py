@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import inspect, text
+
+from database import engine, Base
+from applicants.models import ResumeParseJob, ParsedResume
+
+# Columns added to the resume parsing tables after they were first created
+NEW_COLUMNS = {
+    "resume_parse_jobs": {"owner": "VARCHAR", "heartbeat_at": "DATETIME"},
+    "parsed_resumes": {"parser_version": "VARCHAR"}
+}
+
+def migrate_parse_jobs():
+    """Add the job ownership and parser version columns to existing resume parsing tables"""
+    Base.metadata.create_all(bind=engine, tables=[ResumeParseJob.__table__, ParsedResume.__table__])
+
+    try:
+        inspector = inspect(engine)
+        with engine.begin() as conn:
+            for table, new_columns in NEW_COLUMNS.items():
+                columns = {column["name"] for column in inspector.get_columns(table)}
+                for name, column_type in new_columns.items():
+                    if name not in columns:
+                        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}"))
+                        print(f"✅ Added {name} column to {table} table")
+                if table == "resume_parse_jobs" and "owner" not in columns:
+                    conn.execute(text("CREATE INDEX ix_resume_parse_jobs_owner ON resume_parse_jobs (owner)"))
+        # Cached parses without a version never match a lookup and are replaced when re-parsed
+        print("✅ Parse job migration completed successfully")
+    except Exception as e:
+        print(f"❌ Error migrating resume parsing tables: {e}")
+
+if __name__ == "__main__":
+    migrate_parse_jobs()
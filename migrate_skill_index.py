@@ -0,0 +1,33 @@
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import SessionLocal, engine, Base
+from auth.models import User
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from interviews.models import Interview
+from offers.models import OfferLetter
+from matching.models import ApplicantSkill, JobSkill, JobApplicantScore
+from matching.crud import rebuild_skill_index, rebuild_match_scores
+
+def migrate_skill_index():
+    # Create the index and score tables if they don't exist yet
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        counts = rebuild_skill_index(db)
+        print(f"✅ Indexed {counts['applicant_skills']} applicant skills and {counts['job_skills']} job skills")
+        scores = rebuild_match_scores(db)
+        print(f"✅ Materialized {scores} job/applicant match scores")
+    except Exception as e:
+        print(f"❌ Error rebuilding skill index and match scores: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    migrate_skill_index()
@@ -0,0 +1,84 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Optional
+
+class OfferPDFCache:
+    """
+    Rendered offer PDFs on disk, named by a hash of everything that went into
+    the letter, and kept under `max_bytes` by evicting the least recently used.
+    Files may vanish underneath it (another process evicting, disk cleanup);
+    callers render the letter again on a miss.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def _load(self) -> None:
+        # Adopt the files left by earlier runs, oldest first
+        if self._entries is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name[:-len(".pdf")], stat.st_size))
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(files))
+        self._size = sum(self._entries.values())
+
+    def get(self, key: str) -> Optional[int]:
+        """Size of the cached PDF, marking it recently used, or None if it is not cached"""
+        with self._lock:
+            self._load()
+            size = self._entries.get(key)
+            if size is not None:
+                self._entries.move_to_end(key)
+            return size
+
+    def open(self, key: str) -> BinaryIO:
+        """Raises FileNotFoundError if the file was removed behind the cache's back"""
+        return open(self.path(key), "rb")
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._load()
+            self._size -= self._entries.pop(key, 0)
+
+    def put(self, key: str, data: bytes) -> None:
+        # Write via rename so concurrent readers never see a partial file
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as buffer:
+            buffer.write(data)
+        os.replace(temp_path, path)
+
+        evicted = []
+        with self._lock:
+            self._load()
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                old_key, old_size = self._entries.popitem(last=False)
+                self._size -= old_size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            try:
+                os.remove(self.path(old_key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._load()
+            return {"entries": len(self._entries), "bytes": self._size, "max_bytes": self.max_bytes}
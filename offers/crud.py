@@ -1,13 +1,18 @@
-from sqlalchemy.orm import Session
-from offers.models import OfferLetter
-from offers.schemas import OfferLetterCreate
-from typing import List
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload
+from offers.models import OfferLetter, OfferTemplate
+from jobs.models import JobPosition
+from auth.models import User
+from applicants.models import Applicant
+from offers.schemas import OfferLetterCreate, OfferBatchItem, OfferTemplateUpdate
+from offers.templates import DEFAULT_TEMPLATE
+from typing import Dict, List, Optional, Set, Tuple
+from core.pagination import keyset_by_id
 
-def create_offer_letter(db: Session, offer: OfferLetterCreate, pdf_path: str):
+def create_offer_letter(db: Session, offer: OfferLetterCreate):
     db_offer = OfferLetter(
         applicant_id=offer.applicant_id,
         position_id=offer.position_id,
-        pdf_path=pdf_path,
         salary=offer.salary,
         start_date=offer.start_date
     )
@@ -16,19 +21,119 @@ def create_offer_letter(db: Session, offer: OfferLetterCreate, pdf_path: str):
     db.refresh(db_offer)
     return db_offer
 
+def create_offer_letters_bulk(db: Session, position_id: int, items: List[OfferBatchItem]) -> List[int]:
+    """Insert offers for one position in a single transaction and return their ids in order"""
+    db_offers = [
+        OfferLetter(
+            applicant_id=item.applicant_id,
+            position_id=position_id,
+            salary=item.salary,
+            start_date=item.start_date
+        )
+        for item in items
+    ]
+    db.add_all(db_offers)
+    db.flush()
+    # Read the ids before commit expires the objects
+    offer_ids = [db_offer.id for db_offer in db_offers]
+    db.commit()
+    return offer_ids
+
+def get_position_with_applicants(db: Session, position_id: int, applicant_ids: List[int]) -> Tuple[Optional[Row], Set[int]]:
+    """
+    The position's company_id plus whichever of `applicant_ids`
+    exist, in one query. The position is None if it does not exist.
+    """
+    rows = db.query(
+        JobPosition.company_id,
+        Applicant.id.label("applicant_id")
+    ).outerjoin(Applicant, Applicant.id.in_(applicant_ids)).filter(JobPosition.id == position_id).all()
+    if not rows:
+        return None, set()
+    return rows[0], {row.applicant_id for row in rows if row.applicant_id is not None}
+
+def get_offer_render_data(db: Session, offer_id: int) -> Optional[Row]:
+    """
+    Everything needed to authorize and render an offer letter in one query:
+    the offer's terms, the position and its company (with any template) and the applicant
+    """
+    return db.query(
+        OfferLetter.id,
+        OfferLetter.salary,
+        OfferLetter.start_date,
+        OfferLetter.created_at,
+        JobPosition.company_id,
+        JobPosition.title.label("position_title"),
+        User.username.label("company_name"),
+        Applicant.user_id.label("applicant_user_id"),
+        Applicant.name.label("applicant_name"),
+        OfferTemplate
+    ).outerjoin(JobPosition, OfferLetter.position_id == JobPosition.id).outerjoin(
+        User, JobPosition.company_id == User.id
+    ).outerjoin(Applicant, OfferLetter.applicant_id == Applicant.id).outerjoin(
+        OfferTemplate, OfferTemplate.company_id == JobPosition.company_id
+    ).filter(OfferLetter.id == offer_id).first()
+
 def get_offer_letter(db: Session, offer_id: int):
     return db.query(OfferLetter).filter(OfferLetter.id == offer_id).first()
 
-def get_offers(db: Session, skip: int = 0, limit: int = 100) -> List[OfferLetter]:
-    return db.query(OfferLetter).offset(skip).limit(limit).all()
+def get_offer_with_owners(db: Session, offer_id: int):
+    """Offer with its position's company and its applicant's user, in one query"""
+    return db.query(OfferLetter).options(
+        joinedload(OfferLetter.position).load_only(JobPosition.id, JobPosition.company_id),
+        joinedload(OfferLetter.applicant).load_only(Applicant.id, Applicant.user_id)
+    ).filter(OfferLetter.id == offer_id).first()
+
+def get_offers(db: Session, limit: int = 100, after_id: Optional[int] = None) -> List[OfferLetter]:
+    return keyset_by_id(db.query(OfferLetter), OfferLetter.id, after_id, limit)
+
+def get_offers_by_company(db: Session, company_id: int, limit: int = 100, after_id: Optional[int] = None) -> List[OfferLetter]:
+    """Offers for the company's own positions, skipping offers without an applicant"""
+    query = db.query(OfferLetter).join(JobPosition, OfferLetter.position_id == JobPosition.id).filter(
+        JobPosition.company_id == company_id,
+        OfferLetter.applicant_id.isnot(None)
+    )
+    return keyset_by_id(query, OfferLetter.id, after_id, limit)
 
 def get_offers_by_applicant_id(db: Session, applicant_id: int) -> List[OfferLetter]:
     return db.query(OfferLetter).filter(OfferLetter.applicant_id == applicant_id).all()
 
+def get_offers_by_applicant_user(db: Session, user_id: int, limit: int = 100, after_id: Optional[int] = None) -> List[OfferLetter]:
+    query = db.query(OfferLetter).join(Applicant, OfferLetter.applicant_id == Applicant.id).filter(Applicant.user_id == user_id)
+    return keyset_by_id(query, OfferLetter.id, after_id, limit)
+
 def delete_offer_letter(db: Session, offer_id: int):
-    db_offer = db.query(OfferLetter).filter(OfferLetter.id == offer_id).first()
+    db_offer = db.get(OfferLetter, offer_id)
     if db_offer:
         db.delete(db_offer)
         db.commit()
         return True
-    return False
\ No newline at end of file
+    return False
+
+def get_offer_template(db: Session, company_id: int):
+    return db.query(OfferTemplate).filter(OfferTemplate.company_id == company_id).first()
+
+def template_sections(db_template: Optional[OfferTemplate]) -> Optional[Dict[str, Optional[str]]]:
+    """Section texts to hand to the renderer, None for the default template"""
+    if db_template is None:
+        return None
+    return {name: getattr(db_template, name) for name in DEFAULT_TEMPLATE}
+
+def set_offer_template(db: Session, company_id: int, template: OfferTemplateUpdate):
+    db_template = get_offer_template(db, company_id)
+    if db_template is None:
+        db_template = OfferTemplate(company_id=company_id)
+        db.add(db_template)
+    for name, text in template.dict().items():
+        setattr(db_template, name, text)
+    db.commit()
+    db.refresh(db_template)
+    return db_template
+
+def delete_offer_template(db: Session, company_id: int):
+    db_template = get_offer_template(db, company_id)
+    if db_template:
+        db.delete(db_template)
+        db.commit()
+        return True
+    return False
@@ -1,20 +1,39 @@
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
 
 class OfferLetter(Base):
+    """The terms of an offer; its PDF is rendered from them on first download"""
     __tablename__ = "offers"
 
     id = Column(Integer, primary_key=True, index=True)
-    applicant_id = Column(Integer, ForeignKey("applicants.id"))
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), index=True)
     position_id = Column(Integer, ForeignKey("jobs.id"))
-    pdf_path = Column(String)
     salary = Column(Float, nullable=True)
     start_date = Column(String, nullable=True)
     created_at = Column(DateTime, default=func.now())
     
+    __table_args__ = (
+        # Company-scoped listing: offers of a position in id order
+        Index("ix_offers_position_id_id", "position_id", "id"),
+    )
+    
     # Relationships
     applicant = relationship("Applicant", back_populates="offers")
     position = relationship("JobPosition", back_populates="offers")
+
+class OfferTemplate(Base):
+    """A company's offer letter wording; sections left empty use the default template"""
+    __tablename__ = "offer_templates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(Integer, ForeignKey("users.id"), unique=True, index=True)
+    title = Column(Text, nullable=True)
+    greeting = Column(Text, nullable=True)
+    body = Column(Text, nullable=True)
+    terms = Column(Text, nullable=True)
+    closing = Column(Text, nullable=True)
+    signature = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -1,10 +1,11 @@
 
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate
 from datetime import datetime
-import os
+from io import BytesIO
+from typing import Dict, Optional
+
+from offers.templates import get_template
 
 def generate_offer_letter_pdf(
     applicant_name: str,
@@ -12,92 +13,25 @@ def generate_offer_letter_pdf(
     company_name: str,
     salary: float = None,
     start_date: str = None,
-    output_path: str = None
-) -> str:
-    """Generate a professional offer letter PDF"""
-    
-    if not output_path:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"offer_letter_{applicant_name.replace(' ', '_')}_{timestamp}.pdf"
-        output_path = os.path.join("offer_letters", filename)
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Header style
-    header_style = ParagraphStyle(
-        'CustomHeader',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=1  # Center alignment
-    )
-    
-    # Add header
-    story.append(Paragraph("OFFER LETTER", header_style))
-    story.append(Spacer(1, 20))
-    
-    # Date
-    date_str = datetime.now().strftime("%B %d, %Y")
-    story.append(Paragraph(f"Date: {date_str}", styles['Normal']))
-    story.append(Spacer(1, 20))
-    
-    # Recipient
-    story.append(Paragraph(f"Dear {applicant_name},", styles['Normal']))
-    story.append(Spacer(1, 12))
-    
-    # Main content
-    content = f"""
-    We are pleased to extend an offer of employment for the position of <b>{position_title}</b> 
-    at {company_name}. We believe your skills and experience make you an excellent fit for our team.
-    """
-    story.append(Paragraph(content, styles['Normal']))
-    story.append(Spacer(1, 12))
-    
-    # Position details
-    details = f"<b>Position:</b> {position_title}<br/>"
-    if salary:
-        details += f"<b>Annual Salary:</b> ${salary:,.2f}<br/>"
-    if start_date:
-        details += f"<b>Start Date:</b> {start_date}<br/>"
-    
-    story.append(Paragraph(details, styles['Normal']))
-    story.append(Spacer(1, 12))
-    
-    # Terms and conditions
-    terms = """
-    This offer is contingent upon:
-    <br/>• Successful completion of background verification
-    <br/>• Verification of employment eligibility
-    <br/>• Signed acceptance of this offer letter
+    date: Optional[datetime] = None,
+    template: Optional[Dict[str, Optional[str]]] = None
+) -> bytes:
     """
-    story.append(Paragraph(terms, styles['Normal']))
-    story.append(Spacer(1, 20))
-    
-    # Closing
-    closing = f"""
-    We are excited about the possibility of you joining our team at {company_name}. 
-    Please confirm your acceptance by signing and returning this letter.
+    Generate a professional offer letter PDF from the company's template sections (default if None).
+    The same arguments always give the same bytes; `date` is the offer's date, today if None.
     """
-    story.append(Paragraph(closing, styles['Normal']))
-    story.append(Spacer(1, 30))
-    
-    # Signature lines
-    story.append(Paragraph("Sincerely,", styles['Normal']))
-    story.append(Spacer(1, 20))
-    story.append(Paragraph(f"{company_name} HR Department", styles['Normal']))
-    story.append(Spacer(1, 40))
-    
-    story.append(Paragraph("Acceptance:", styles['Normal']))
-    story.append(Spacer(1, 20))
-    story.append(Paragraph("_" * 30 + "  Date: _" * 15, styles['Normal']))
-    story.append(Paragraph(f"{applicant_name}", styles['Normal']))
-    
-    # Build PDF
-    doc.build(story)
-    return output_path
+
+    # Styles and static sections are compiled once per process; only the fields are laid out per letter
+    story = get_template(template).story({
+        "applicant_name": applicant_name,
+        "position_title": position_title,
+        "company_name": company_name,
+        "salary": salary,
+        "start_date": start_date,
+        "date": (date or datetime.now()).strftime("%B %d, %Y")
+    })
+
+    # Build PDF in memory; invariant fixes the creation date and document id so re-renders match
+    buffer = BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter, invariant=1).build(story)
+    return buffer.getvalue()
@@ -1,45 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
-import os
-
-from database import get_db
+from typing import List, Optional
+from io import BytesIO
+import asyncio
+
+from database import get_db, get_async_db, AsyncSession
+from core.config import settings
+from core.pagination import decode_id_cursor, page_by_id
+from core.responses import stream_response
 from auth.router import get_current_user, require_role
-from auth.models import User
+from auth.cache import UserPrincipal
 from offers import schemas, crud
-from offers.pdf_generator import generate_offer_letter_pdf
+from offers.worker import offer_pdf_cache, render_key, render_offer_pdf
+from offers.templates import DEFAULT_TEMPLATE, validate_template
 from jobs.crud import get_job
 from applicants.crud import get_applicant
+from core.workers import QueueFullError
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.OfferLetter])
 def list_offers(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """List offers - companies see all, applicants see their own"""
+    """List offers - companies see offers for their positions, applicants see their own; the next page's cursor is in X-Next-Cursor"""
+    after_id = decode_id_cursor(cursor)
     if current_user.role.value == "company":
-        offers = crud.get_offers(db)
-        # Filter out offers with null applicant_id to prevent validation errors
-        return [offer for offer in offers if offer.applicant_id is not None]
+        offers = crud.get_offers_by_company(db, company_id=current_user.id, limit=limit + 1, after_id=after_id)
+        return page_by_id(offers, limit, response)
     else:
         # For applicants, get offers for their applicant profile
-        from applicants.crud import get_applicant_by_user_id
-        applicant = get_applicant_by_user_id(db, user_id=current_user.id)
-        if applicant:
-            offers = crud.get_offers_by_applicant_id(db, applicant_id=applicant.id)
-            return [offer for offer in offers if offer.applicant_id is not None]
-        return []
+        offers = crud.get_offers_by_applicant_user(db, user_id=current_user.id, limit=limit + 1, after_id=after_id)
+        return page_by_id(offers, limit, response)
 
 @router.post("/", response_model=schemas.OfferLetter)
 def generate_offer_letter(
     offer: schemas.OfferLetterCreate,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
-    """Generate and create offer letter PDF"""
+    """Create an offer letter; its PDF is rendered on first download"""
     # Verify job belongs to the company
     job = get_job(db, job_id=offer.position_id)
     if not job or job.company_id != current_user.id:
@@ -51,78 +55,163 @@ def generate_offer_letter(
         raise HTTPException(status_code=404, detail="Applicant not found")
 
     try:
-        # Generate PDF
-        pdf_path = generate_offer_letter_pdf(
-            applicant_name=applicant.name,
-            position_title=job.title,
-            company_name=current_user.username,  # Using username as company name
-            salary=offer.salary,
-            start_date=offer.start_date
-        )
+        return crud.create_offer_letter(db=db, offer=offer)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating offer letter: {str(e)}")
+
+@router.post("/batch", response_model=schemas.OfferBatchResult)
+def generate_offer_letters_batch(
+    batch: schemas.OfferBatchCreate,
+    current_user: UserPrincipal = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Create offer letters for several applicants to one position in one transaction"""
+    if not batch.offers:
+        raise HTTPException(status_code=400, detail="No offers to generate")
+    if len(batch.offers) > settings.OFFER_BATCH_MAX_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {settings.OFFER_BATCH_MAX_SIZE} offers per batch")
+
+    position, applicant_ids = crud.get_position_with_applicants(
+        db, batch.position_id, list({item.applicant_id for item in batch.offers})
+    )
+    if not position or position.company_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to create offer for this position")
 
-        # Save to database
-        return crud.create_offer_letter(db=db, offer=offer, pdf_path=pdf_path)
+    results = [schemas.OfferBatchItemResult(applicant_id=item.applicant_id) for item in batch.offers]
+    valid = [(result, item) for result, item in zip(results, batch.offers) if item.applicant_id in applicant_ids]
+    for result in results:
+        if result.applicant_id not in applicant_ids:
+            result.error = "Applicant not found"
 
+    try:
+        offer_ids = crud.create_offer_letters_bulk(db, batch.position_id, [item for _, item in valid])
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating offer letter: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating offer letters: {str(e)}")
+
+    for (result, _), offer_id in zip(valid, offer_ids):
+        result.offer_id = offer_id
+
+    return schemas.OfferBatchResult(
+        position_id=batch.position_id,
+        created=len(offer_ids),
+        failed=len(results) - len(offer_ids),
+        results=results
+    )
+
+@router.get("/template", response_model=schemas.OfferTemplate)
+def get_offer_template(
+    current_user: UserPrincipal = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Get the company's offer letter template; the default is returned if none is registered"""
+    db_template = crud.get_offer_template(db, company_id=current_user.id)
+    if db_template is None:
+        return schemas.OfferTemplate(**DEFAULT_TEMPLATE)
+    return db_template
+
+@router.put("/template", response_model=schemas.OfferTemplate)
+def set_offer_template(
+    template: schemas.OfferTemplateUpdate,
+    current_user: UserPrincipal = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Register the company's offer letter template; sections left out use the default wording"""
+    try:
+        validate_template(template.dict())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid template: {str(e)}")
+    return crud.set_offer_template(db, company_id=current_user.id, template=template)
+
+@router.delete("/template")
+def delete_offer_template(
+    current_user: UserPrincipal = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Go back to the default offer letter template"""
+    if not crud.delete_offer_template(db, company_id=current_user.id):
+        raise HTTPException(status_code=404, detail="No offer letter template registered")
+    return {"message": "Offer letter template deleted successfully"}
 
 @router.get("/{offer_id}")
-def download_offer_letter(
+async def download_offer_letter(
     offer_id: int,
+    request: Request,
     token: str = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Download offer letter PDF"""
-    offer = crud.get_offer_letter(db, offer_id=offer_id)
+    """Download offer letter PDF, rendering it if it is not in the cache"""
+    offer = await db.run_sync(crud.get_offer_render_data, offer_id)
     if not offer:
         raise HTTPException(status_code=404, detail="Offer letter not found")
 
     # Check authorization
     if current_user.role.value == "company":
         # Companies can download offers they created
-        job = get_job(db, job_id=offer.position_id)
-        if not job or job.company_id != current_user.id:
+        if offer.company_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to download this offer letter")
     else:
         # Applicants can download their own offers
-        applicant = get_applicant(db, applicant_id=offer.applicant_id)
-        if not applicant or applicant.user_id != current_user.id:
+        if offer.applicant_user_id is None or offer.applicant_user_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to download this offer letter")
 
-    # Check if file exists
-    if not os.path.exists(offer.pdf_path):
-        raise HTTPException(status_code=404, detail="PDF file not found")
+    fields = {
+        "applicant_name": offer.applicant_name or "",
+        "position_title": offer.position_title or "",
+        "company_name": offer.company_name or "",  # Using username as company name
+        "salary": offer.salary,
+        "start_date": offer.start_date,
+        "date": offer.created_at
+    }
+    template = crud.template_sections(offer.OfferTemplate)
+    key = render_key(fields, template)
+    filename = f"offer_letter_{offer.id}.pdf"
+
+    size = offer_pdf_cache.get(key)
+    if size is not None:
+        try:
+            return stream_response(
+                request, lambda: offer_pdf_cache.open(key), size=size, etag=key,
+                media_type='application/pdf', filename=filename
+            )
+        except FileNotFoundError:
+            # Evicted by another process or removed from disk: render it again
+            offer_pdf_cache.discard(key)
 
-    return FileResponse(
-        path=offer.pdf_path,
-        media_type='application/pdf',
-        filename=os.path.basename(offer.pdf_path)
+    try:
+        pdf_bytes = await asyncio.wrap_future(render_offer_pdf(key, fields, template))
+    except QueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many offer letters are being generated, please try again shortly",
+            headers={"Retry-After": "10"}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating offer letter: {str(e)}")
+
+    return stream_response(
+        request, lambda: BytesIO(pdf_bytes), size=len(pdf_bytes), etag=key,
+        media_type='application/pdf', filename=filename
     )
 
 @router.delete("/{offer_id}")
 def delete_offer(
     offer_id: int,
-    current_user: User = Depends(require_role("company")),
+    current_user: UserPrincipal = Depends(require_role("company")),
     db: Session = Depends(get_db)
 ):
-    """Delete an offer letter"""
-    offer = crud.get_offer_letter(db, offer_id=offer_id)
+    """Delete an offer letter; its cached PDF ages out of the cache"""
+    offer = crud.get_offer_with_owners(db, offer_id=offer_id)
     if not offer:
         raise HTTPException(status_code=404, detail="Offer letter not found")
 
     # Check authorization - only company that created the offer can delete it
-    job = get_job(db, job_id=offer.position_id)
-    if not job or job.company_id != current_user.id:
+    if not offer.position or offer.position.company_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this offer letter")
 
-    # Delete PDF file if it exists
-    if os.path.exists(offer.pdf_path):
-        os.remove(offer.pdf_path)
-
     # Delete from database
     success = crud.delete_offer_letter(db, offer_id=offer_id)
     if success:
         return {"message": "Offer letter deleted successfully"}
     else:
-        raise HTTPException(status_code=500, detail="Error deleting offer letter")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Error deleting offer letter")
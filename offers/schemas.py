@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class OfferLetterCreate(BaseModel):
     applicant_id: int
@@ -12,10 +12,44 @@ class OfferLetter(BaseModel):
     id: int
     applicant_id: int
     position_id: int
-    pdf_path: str
     salary: Optional[float] = None
     start_date: Optional[str] = None
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+class OfferBatchItem(BaseModel):
+    applicant_id: int
+    salary: float
+    start_date: str
+
+class OfferBatchCreate(BaseModel):
+    position_id: int
+    offers: List[OfferBatchItem]
+
+class OfferBatchItemResult(BaseModel):
+    applicant_id: int
+    offer_id: Optional[int] = None
+    error: Optional[str] = None
+
+class OfferBatchResult(BaseModel):
+    position_id: int
+    created: int
+    failed: int
+    results: List[OfferBatchItemResult]
+
+class OfferTemplateUpdate(BaseModel):
+    """Offer letter sections; placeholders: {applicant_name}, {position_title}, {company_name}, {salary}, {start_date}, {date}"""
+    title: Optional[str] = None
+    greeting: Optional[str] = None
+    body: Optional[str] = None
+    terms: Optional[str] = None
+    closing: Optional[str] = None
+    signature: Optional[str] = None
+
+class OfferTemplate(OfferTemplateUpdate):
+    company_id: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
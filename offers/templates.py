@@ -0,0 +1,153 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import Paragraph, Spacer
+
+# Placeholders a template section may use
+TEMPLATE_FIELDS = ("applicant_name", "position_title", "company_name", "salary", "start_date", "date")
+
+# The sections of an offer letter, in page order
+DEFAULT_TEMPLATE: Dict[str, str] = {
+    "title": "OFFER LETTER",
+    "greeting": "Dear {applicant_name},",
+    "body": """
+    We are pleased to extend an offer of employment for the position of <b>{position_title}</b>
+    at {company_name}. We believe your skills and experience make you an excellent fit for our team.
+    """,
+    "terms": """
+    This offer is contingent upon:
+    <br/>• Successful completion of background verification
+    <br/>• Verification of employment eligibility
+    <br/>• Signed acceptance of this offer letter
+    """,
+    "closing": """
+    We are excited about the possibility of you joining our team at {company_name}.
+    Please confirm your acceptance by signing and returning this letter.
+    """,
+    "signature": "{company_name} HR Department"
+}
+
+# Sections use the normal body style unless listed here
+SECTION_STYLES = {"title": "header"}
+
+SAMPLE_FIELDS = {
+    "applicant_name": "Sample Applicant",
+    "position_title": "Sample Position",
+    "company_name": "Sample Company",
+    "salary": "$100,000.00",
+    "start_date": "January 1, 2030",
+    "date": "January 1, 2030"
+}
+
+@lru_cache(maxsize=1)
+def offer_styles() -> Dict[str, ParagraphStyle]:
+    """Paragraph styles, built once per process"""
+    styles = getSampleStyleSheet()
+    return {
+        "header": ParagraphStyle(
+            'CustomHeader',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        ),
+        "normal": styles['Normal']
+    }
+
+def template_placeholders(text: str) -> List[str]:
+    """
+    Field names of the placeholders in a section. Only bare {field} is allowed:
+    a format spec or conversion (e.g. {applicant_name:>999999999}) raises ValueError.
+    """
+    placeholders = []
+    for _, field, format_spec, conversion in Formatter().parse(text):
+        if field is None:
+            continue
+        if format_spec or conversion:
+            raise ValueError(f"Placeholder {{{field}}} may not have a format spec or conversion")
+        placeholders.append(field)
+    return placeholders
+
+class CompiledTemplate:
+    """
+    An offer letter template laid out ahead of time. Sections without
+    placeholders become Paragraphs once and are shared by every letter;
+    the rest are filled in and parsed per render.
+    """
+
+    def __init__(self, sections: Dict[str, str]):
+        self.sections = {name: self._compile(name, sections[name]) for name in DEFAULT_TEMPLATE}
+        normal = offer_styles()["normal"]
+        self.sincerely = Paragraph("Sincerely,", normal)
+        self.acceptance = Paragraph("Acceptance:", normal)
+        self.signature_line = Paragraph("_" * 30 + "  Date: _" * 15, normal)
+
+    @staticmethod
+    def _compile(name: str, text: str):
+        placeholders = template_placeholders(text)
+        unknown = [field for field in placeholders if field not in TEMPLATE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown placeholders in {name}: {', '.join(unknown)}")
+        # A static section is kept as its finished Paragraph, a variable one as its text
+        return text if placeholders else Paragraph(text, offer_styles()[SECTION_STYLES.get(name, "normal")])
+
+    def _section(self, name: str, values: Dict[str, str]):
+        section = self.sections[name]
+        if isinstance(section, Paragraph):
+            return section
+        return Paragraph(section.format(**values), offer_styles()[SECTION_STYLES.get(name, "normal")])
+
+    def story(self, fields: Dict[str, Any]) -> list:
+        """Flowables for one letter; `fields` values are plain text and escaped here"""
+        fields = dict(fields)
+        if isinstance(fields.get("salary"), (int, float)):
+            fields["salary"] = f"${fields['salary']:,.2f}"
+        values = {field: escape(str(fields.get(field) or "")) for field in TEMPLATE_FIELDS}
+        normal = offer_styles()["normal"]
+
+        details = f"<b>Position:</b> {values['position_title']}<br/>"
+        if fields.get("salary"):
+            details += f"<b>Annual Salary:</b> {values['salary']}<br/>"
+        if fields.get("start_date"):
+            details += f"<b>Start Date:</b> {values['start_date']}<br/>"
+
+        return [
+            self._section("title", values),
+            Spacer(1, 20),
+            Paragraph(f"Date: {values['date']}", normal),
+            Spacer(1, 20),
+            self._section("greeting", values),
+            Spacer(1, 12),
+            self._section("body", values),
+            Spacer(1, 12),
+            Paragraph(details, normal),
+            Spacer(1, 12),
+            self._section("terms", values),
+            Spacer(1, 20),
+            self._section("closing", values),
+            Spacer(1, 30),
+            self.sincerely,
+            Spacer(1, 20),
+            self._section("signature", values),
+            Spacer(1, 40),
+            self.acceptance,
+            Spacer(1, 20),
+            self.signature_line,
+            Paragraph(values['applicant_name'], normal)
+        ]
+
+@lru_cache(maxsize=128)
+def _compiled(sections: Tuple[Tuple[str, str], ...]) -> CompiledTemplate:
+    return CompiledTemplate(dict(sections))
+
+def get_template(sections: Optional[Dict[str, Optional[str]]] = None) -> CompiledTemplate:
+    """Compiled template for a company's sections (missing ones use the default), cached per process"""
+    merged = {name: (sections or {}).get(name) or default for name, default in DEFAULT_TEMPLATE.items()}
+    return _compiled(tuple(sorted(merged.items())))
+
+def validate_template(sections: Dict[str, Optional[str]]) -> None:
+    """Raise ValueError if a template has unknown placeholders or markup ReportLab cannot parse"""
+    get_template(sections).story(SAMPLE_FIELDS)
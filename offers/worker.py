@@ -0,0 +1,61 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import threading
+
+from core.config import settings
+from core.workers import BoundedProcessPool
+from offers.cache import OfferPDFCache
+from offers.pdf_generator import generate_offer_letter_pdf
+from offers.templates import get_template
+
+# Bump when the letter layout changes so cached PDFs are rendered again
+RENDER_VERSION = 1
+
+offer_render_pool = BoundedProcessPool(
+    "offer renderer",
+    max_workers=settings.OFFER_RENDER_WORKERS,
+    max_pending=settings.OFFER_RENDER_QUEUE_SIZE,
+    initializer=get_template  # compile the styles and default template as each worker starts
+)
+
+offer_pdf_cache = OfferPDFCache(settings.OFFER_CACHE_DIR, settings.OFFER_CACHE_MAX_BYTES)
+
+# Rendered PDFs are written to the cache on a single thread so the pool's result handler never waits on the disk
+_result_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="offer-render-writer")
+
+# Renders in progress by cache key, so simultaneous first downloads share one render
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+def render_key(fields: Dict[str, Any], template: Optional[Dict[str, Optional[str]]]) -> str:
+    """
+    Hash of everything that goes into a letter. Rendering is deterministic,
+    so it names the cached file and doubles as the download's ETag.
+    """
+    payload = json.dumps({"version": RENDER_VERSION, "fields": fields, "template": template}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def render_offer_pdf(key: str, fields: Dict[str, Any], template: Optional[Dict[str, Optional[str]]] = None) -> Future:
+    """Render an offer letter in the worker pool and cache the bytes under `key`. Raises QueueFullError."""
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        future = offer_render_pool.submit(generate_offer_letter_pdf, template=template, **fields)
+        _in_flight[key] = future
+    future.add_done_callback(lambda done: _result_writer.submit(_finish_render, key, done))
+    return future
+
+def _finish_render(key: str, future: Future) -> None:
+    try:
+        if not future.cancelled() and future.exception() is None:
+            offer_pdf_cache.put(key, future.result())
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+
+def shutdown() -> None:
+    offer_render_pool.shutdown()
+    _result_writer.shutdown()
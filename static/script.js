@@ -684,7 +684,7 @@ async function saveApplicant(event) {
         });
 
         if (response.ok) {
-            showToast('Applicant profile created successfully!', 'success');
+            showToast('Applicant profile created! Your resume is being processed.', 'success');
             hideApplicantForm();
             loadApplicants();
             document.getElementById('applicant-form').querySelector('form').reset();
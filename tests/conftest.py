@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+# Settings are read at import time, so point them at a scratch database before the app is imported
+_scratch = tempfile.mkdtemp(prefix="recruitment-tracker-tests-")
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{os.path.join(_scratch, 'test.db')}",
+    UPLOAD_DIR=os.path.join(_scratch, "uploads"),
+    OFFER_LETTERS_DIR=os.path.join(_scratch, "offer_letters"),
+    QUERY_COUNT_HEADER="1",
+    BCRYPT_ROUNDS="4"
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+def _sign_up(client, username: str, role: str) -> dict:
+    client.post("/auth/register", json={"username": username, "email": f"{username}@example.com", "password": "pw", "role": role})
+    response = client.post("/auth/token", data={"username": username, "password": "pw"})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture(scope="session")
+def company(client) -> dict:
+    return _sign_up(client, "company", "company")
+
+@pytest.fixture(scope="session")
+def applicant_user(client) -> dict:
+    return _sign_up(client, "applicant", "applicant")
+
+
+@pytest.fixture
+def new_user(client):
+    """Sign up a user nobody else has touched: new_user("applicant") returns its auth headers"""
+    return lambda role: _sign_up(client, f"{role}-{uuid.uuid4().hex[:8]}", role)
@@ -0,0 +1,51 @@
+"""Bulk ingestion keeps stored resumes only while an applicant uses them"""
+import os
+import uuid
+from io import BytesIO
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from core.config import settings
+from database import SessionLocal
+from applicants import crud
+from applicants.bulk import ingest_resumes
+from applicants.schemas import ApplicantCreate
+from applicants.storage import resume_digest, store_resume
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+def make_pdf(text: str) -> bytes:
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.drawString(72, 720, text)
+    pdf.save()
+    return buffer.getvalue()
+
+def not_a_pdf() -> bytes:
+    return f"not a pdf {uuid.uuid4().hex}".encode()
+
+def test_unparseable_resumes_are_not_kept(db):
+    broken = not_a_pdf()
+    broken_path = os.path.join(settings.UPLOAD_DIR, f"{resume_digest(broken)}.pdf")
+
+    report = ingest_resumes(db, iter([("broken.pdf", broken), ("valid.pdf", make_pdf(f"Python {uuid.uuid4().hex}"))]))
+
+    assert [failure["file"] for failure in report["failed"]] == ["broken.pdf"]
+    assert report["created"] == 1
+    assert not os.path.exists(broken_path)
+    assert os.path.exists(crud.get_applicant(db, report["applicant_ids"][0]).resume_path)
+
+def test_files_used_by_another_applicant_are_kept(db):
+    broken = not_a_pdf()
+    _, resume_path = store_resume(broken)
+    crud.create_applicant(db, ApplicantCreate(name="Existing", email="existing@example.com"), user_id=None, resume_path=resume_path)
+
+    report = ingest_resumes(db, iter([("same-content.pdf", broken)]))
+
+    assert [failure["file"] for failure in report["failed"]] == ["same-content.pdf"]
+    assert os.path.exists(resume_path)
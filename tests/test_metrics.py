@@ -0,0 +1,12 @@
+"""Worker metrics are only shown to company users"""
+
+def test_metrics_require_login(client):
+    assert client.get("/api/metrics").status_code == 401
+
+def test_metrics_are_hidden_from_applicants(client, applicant_user):
+    assert client.get("/api/metrics", headers=applicant_user).status_code == 403
+
+def test_metrics_for_company(client, company):
+    response = client.get("/api/metrics", headers=company)
+    assert response.status_code == 200
+    assert "resume_parsing" in response.json()
@@ -0,0 +1,20 @@
+"""Offer letter templates accept only bare {field} placeholders"""
+import pytest
+
+@pytest.mark.parametrize("greeting", [
+    "Dear {applicant_name:>999999999},",
+    "Dear {applicant_name!r},",
+    "Dear {applicant_name!s:^20},",
+    "Dear {applicant_name.__class__},",
+    "Dear {applicant_name[0]},",
+    "Dear {password},",
+    "Dear {applicant_name,",
+])
+def test_invalid_placeholders_are_rejected(client, company, greeting):
+    response = client.put("/offers/template", json={"greeting": greeting}, headers=company)
+    assert response.status_code == 400, response.text
+
+def test_plain_placeholders_are_accepted(client, company):
+    response = client.put("/offers/template", json={"greeting": "Hello {applicant_name}, welcome to {company_name}"}, headers=company)
+    assert response.status_code == 200, response.text
+    client.delete("/offers/template", headers=company)
@@ -0,0 +1,49 @@
+"""Cached resume parses are only reused by the parser version that produced them"""
+import json
+import uuid
+
+import pytest
+
+from core.config import settings
+from database import SessionLocal
+from applicants import crud, parser
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+@pytest.fixture
+def fresh_version(monkeypatch):
+    """Recompute parser_version() with patched settings, restoring the cached value afterwards"""
+    parser.parser_version.cache_clear()
+    yield
+    parser.parser_version.cache_clear()
+
+def test_other_parser_versions_miss(db):
+    sha256 = uuid.uuid4().hex
+    crud.save_parsed_resume(db, sha256, "v1", "resume.pdf", "text", ["Python"], {})
+    assert crud.get_parsed_resume(db, sha256, "v1").skills == ["Python"]
+    assert crud.get_parsed_resume(db, sha256, "v2") is None
+
+def test_reparse_replaces_stale_entry(db):
+    sha256 = uuid.uuid4().hex
+    crud.save_parsed_resume(db, sha256, "v1", "resume.pdf", "text", ["Python"], {})
+    crud.save_parsed_resume(db, sha256, "v2", "resume.pdf", "text", ["Python", "SQL"], {})
+    assert crud.get_parsed_resume(db, sha256, "v2").skills == ["Python", "SQL"]
+    assert crud.get_parsed_resume(db, sha256, "v1") is None
+
+def test_version_follows_skill_dictionary(tmp_path, monkeypatch, fresh_version):
+    before = parser.parser_version()
+    dictionary = tmp_path / "skills.json"
+    dictionary.write_text(json.dumps({"Zig": ["ziglang"]}))
+    monkeypatch.setattr(settings, "SKILL_DICTIONARY_PATH", str(dictionary))
+    parser.parser_version.cache_clear()
+    assert parser.parser_version() != before
+
+def test_version_follows_extraction_limits(monkeypatch, fresh_version):
+    before = parser.parser_version()
+    monkeypatch.setattr(settings, "RESUME_MAX_PAGES", settings.RESUME_MAX_PAGES + 1)
+    parser.parser_version.cache_clear()
+    assert parser.parser_version() != before
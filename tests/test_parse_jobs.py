@@ -0,0 +1,60 @@
+"""Restarted processes take over only the parse jobs whose owner has stopped"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import SessionLocal
+from applicants import crud, worker
+from applicants.models import ParseStatus
+from applicants.schemas import ApplicantCreate
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+@pytest.fixture
+def submitted(monkeypatch):
+    jobs = []
+    monkeypatch.setattr(worker, "submit_resume_parse", lambda job_id, *args, **kwargs: jobs.append(job_id))
+    return jobs
+
+def make_job(db, tmp_path, owner, heartbeat_age_seconds):
+    resume_path = tmp_path / f"{uuid.uuid4().hex}.pdf"
+    resume_path.write_bytes(b"%PDF-1.4 resume")
+    applicant = crud.create_applicant(db, ApplicantCreate(name="Parsing", email="parsing@example.com"), user_id=None, resume_path=str(resume_path))
+    job = crud.create_parse_job(db, job_id=str(uuid.uuid4()), applicant_id=applicant.id, owner=owner)
+    job.heartbeat_at = datetime.utcnow() - timedelta(seconds=heartbeat_age_seconds) if owner else None
+    db.commit()
+    return job.id
+
+def test_jobs_of_a_live_owner_are_left_alone(db, tmp_path, submitted):
+    live = make_job(db, tmp_path, owner="other-process", heartbeat_age_seconds=1)
+    worker.resume_interrupted_parses()
+    assert live not in submitted
+    db.expire_all()
+    assert crud.get_parse_job(db, live).owner == "other-process"
+
+def test_jobs_of_a_stopped_owner_are_taken_over(db, tmp_path, submitted):
+    stale = make_job(db, tmp_path, owner="stopped-process", heartbeat_age_seconds=3600)
+    unowned = make_job(db, tmp_path, owner=None, heartbeat_age_seconds=0)
+    worker.resume_interrupted_parses()
+    assert stale in submitted and unowned in submitted
+    db.expire_all()
+    assert crud.get_parse_job(db, stale).owner == worker.WORKER_ID
+    assert crud.get_parse_job(db, stale).status == ParseStatus.queued
+
+def test_only_one_process_wins_a_claim(db, tmp_path):
+    job_id = make_job(db, tmp_path, owner="stopped-process", heartbeat_age_seconds=3600)
+    stale_before = datetime.utcnow() - timedelta(seconds=60)
+    assert crud.claim_parse_job(db, job_id, "first", stale_before)
+    assert not crud.claim_parse_job(db, job_id, "second", stale_before)
+    assert crud.get_parse_job(db, job_id).owner == "first"
+
+def test_heartbeat_keeps_own_jobs_fresh(db, tmp_path):
+    job_id = make_job(db, tmp_path, owner=worker.WORKER_ID, heartbeat_age_seconds=3600)
+    assert crud.touch_parse_jobs(db, worker.WORKER_ID) >= 1
+    db.expire_all()
+    assert crud.get_parse_job(db, job_id).heartbeat_at > datetime.utcnow() - timedelta(seconds=60)
@@ -0,0 +1,51 @@
+"""Resumes cut short by the extraction budgets never reach ResumeParser"""
+from io import BytesIO
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from core.config import settings
+from applicants import parser
+
+def make_pdf(pages: int) -> bytes:
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(pages):
+        pdf.drawString(72, 720, f"Page {page + 1}: Python and SQL")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+@pytest.fixture
+def resume_parser(monkeypatch):
+    """Stand-in ResumeParser that records which resumes it was given"""
+    calls = []
+
+    class RecordingResumeParser:
+        def __init__(self, source):
+            calls.append(source)
+
+        def get_extracted_data(self):
+            return {"skills": ["python"]}
+
+    monkeypatch.setattr(parser, "PYRESPARSER_AVAILABLE", True)
+    monkeypatch.setattr(parser, "ResumeParser", RecordingResumeParser, raising=False)
+    monkeypatch.setattr(parser, "load_resume_models", lambda: None)
+    return calls
+
+def test_over_page_limit_skips_resume_parser(monkeypatch, resume_parser):
+    monkeypatch.setattr(settings, "RESUME_MAX_PAGES", 2)
+    text, skills, _ = parser.parse_resume(make_pdf(5))
+    assert resume_parser == []
+    assert "Page 2" in text and "Page 3" not in text
+    assert skills == ["Python", "SQL"]
+
+def test_over_text_limit_skips_resume_parser(monkeypatch, resume_parser):
+    monkeypatch.setattr(settings, "RESUME_MAX_TEXT_CHARS", 10)
+    parser.parse_resume(make_pdf(1))
+    assert resume_parser == []
+
+def test_within_limits_uses_resume_parser(resume_parser):
+    _, skills, _ = parser.parse_resume(make_pdf(2))
+    assert len(resume_parser) == 1
+    assert skills == ["Python"]
@@ -0,0 +1,211 @@
+"""
+SQL statements per endpoint, read from the X-Query-Count header.
+An N+1 regression changes these counts and fails the suite; when a change
+legitimately adds or removes a query, update the expected number here.
+"""
+import time
+import uuid
+import zipfile
+from io import BytesIO
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from database import SessionLocal
+from auth.cache import principal_cache
+from applicants import crud as applicant_crud
+from applicants.schemas import ApplicantCreate
+
+def query_count(response, status_code: int = 200) -> int:
+    assert response.status_code == status_code, response.text
+    return int(response.headers["x-query-count"])
+
+def create_applicant(name: str, user_id: int = None) -> int:
+    """Applicant profile created directly so no resume has to be parsed"""
+    db = SessionLocal()
+    try:
+        return applicant_crud.create_applicant(
+            db, ApplicantCreate(name=name, email=f"{name.lower()}@example.com"), user_id=user_id, skills=["Python"]
+        ).id
+    finally:
+        db.close()
+
+def make_resume() -> bytes:
+    """A PDF no other test uploads, so it is never served from the parse cache"""
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.drawString(72, 720, f"Resume {uuid.uuid4().hex}: Python, SQL")
+    pdf.save()
+    return buffer.getvalue()
+
+def create_job(client, company) -> int:
+    return client.post("/jobs/", json={"title": "Engineer", "description": "Build things", "skills": ["Python"]}, headers=company).json()["id"]
+
+# Read-only for the tests below, so one profile serves the whole module
+@pytest.fixture(scope="module")
+def applicant(client, applicant_user) -> int:
+    return create_applicant("Applicant", user_id=client.get("/auth/me", headers=applicant_user).json()["id"])
+
+# Fixtures that tests update or delete are rebuilt for every test
+@pytest.fixture
+def job(client, company, applicant) -> int:
+    return create_job(client, company)
+
+@pytest.fixture
+def interview(client, company, applicant, job) -> int:
+    response = client.post("/interviews/", json={"applicant_id": applicant, "position_id": job, "date_time": "2030-01-01T10:00:00"}, headers=company)
+    return response.json()["id"]
+
+@pytest.fixture
+def offer(client, company, applicant, job) -> int:
+    response = client.post("/offers/", json={"applicant_id": applicant, "position_id": job, "salary": 100000, "start_date": "2030-02-01"}, headers=company)
+    return response.json()["id"]
+
+@pytest.fixture
+def offer_template(client, company):
+    yield
+    client.delete("/offers/template", headers=company)
+
+@pytest.fixture(params=["company", "applicant_user"])
+def any_user(request) -> dict:
+    return request.getfixturevalue(request.param)
+
+def wait_for_parse(client, headers, job_id: str) -> dict:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        parse_job = client.get(f"/applicants/parse-jobs/{job_id}", headers=headers).json()
+        if parse_job["status"] != "queued":
+            return parse_job
+        time.sleep(0.05)
+    pytest.fail(f"Resume parse {job_id} did not finish")
+
+def test_register(client):
+    username = f"user-{uuid.uuid4().hex[:8]}"
+    response = client.post("/auth/register", json={"username": username, "email": f"{username}@example.com", "password": "pw", "role": "applicant"})
+    assert query_count(response) == 4
+
+def test_token(client, new_user):
+    headers = new_user("company")
+    username = client.get("/auth/me", headers=headers).json()["username"]
+    assert query_count(client.post("/auth/token", data={"username": username, "password": "pw"})) == 1
+
+def test_me(client, new_user):
+    headers = new_user("company")
+    # Signing in caches the user, so routine requests run no query
+    response = client.get("/auth/me", headers=headers)
+    assert query_count(response) == 0
+    principal_cache.invalidate(response.json()["username"])
+    assert query_count(client.get("/auth/me", headers=headers)) == 1
+
+def test_create_job(client, company, applicant):
+    # The applicant matches, so there is always a score row to insert
+    response = client.post("/jobs/", json={"title": "Analyst", "description": "Query things", "skills": ["Python", "SQL"]}, headers=company)
+    assert query_count(response) == 7
+
+def test_list_jobs(client, job):
+    assert query_count(client.get("/jobs/")) == 1
+
+def test_get_job(client, job):
+    assert query_count(client.get(f"/jobs/{job}")) == 1
+
+def test_update_job(client, company, job):
+    assert query_count(client.put(f"/jobs/{job}", json={"title": "Senior Engineer"}, headers=company)) == 3
+
+def test_create_interview(client, company, applicant, job):
+    response = client.post("/interviews/", json={"applicant_id": applicant, "position_id": job, "date_time": "2030-01-02T10:00:00"}, headers=company)
+    assert query_count(response) == 4
+
+def test_list_interviews(client, any_user, interview):
+    assert query_count(client.get("/interviews/", headers=any_user)) == 1
+
+def test_update_interview(client, company, interview):
+    assert query_count(client.put(f"/interviews/{interview}", json={"status": "completed"}, headers=company)) == 3
+
+def test_create_offer(client, company, applicant, job):
+    response = client.post("/offers/", json={"applicant_id": applicant, "position_id": job, "salary": 90000, "start_date": "2030-03-01"}, headers=company)
+    assert query_count(response) == 4
+
+@pytest.mark.parametrize("size", [1, 5])
+def test_create_offers_batch(client, company, job, size):
+    # One lookup for the position and every applicant; SQLite runs one INSERT per row
+    # because it cannot batch inserts that return generated ids
+    applicant_ids = [create_applicant(f"Batch{index}") for index in range(size)]
+    offers = [{"applicant_id": applicant_id, "salary": 70000, "start_date": "2030-05-01"} for applicant_id in applicant_ids]
+    response = client.post("/offers/batch", json={"position_id": job, "offers": offers}, headers=company)
+    assert response.json()["created"] == size
+    assert query_count(response) == 1 + size
+
+def test_list_offers(client, any_user, offer):
+    assert query_count(client.get("/offers/", headers=any_user)) == 1
+
+def test_download_offer(client, any_user, offer):
+    assert query_count(client.get(f"/offers/{offer}", headers=any_user)) == 1
+
+def test_set_offer_template(client, company, offer_template):
+    response = client.put("/offers/template", json={"greeting": "Hello {applicant_name},"}, headers=company)
+    assert query_count(response) == 3
+
+def test_list_applicants(client, company, applicant):
+    assert query_count(client.get("/applicants/", headers=company)) == 1
+
+def test_get_applicant(client, applicant_user, applicant):
+    assert query_count(client.get(f"/applicants/{applicant}", headers=applicant_user)) == 1
+
+def test_register_applicant(client, new_user, job):
+    headers = new_user("applicant")
+    files = {"resume": ("resume.pdf", make_resume(), "application/pdf")}
+    response = client.post("/applicants/", data={"name": "Uploader", "email": "uploader@example.com"}, files=files, headers=headers)
+    assert query_count(response, status_code=202) == 6
+    wait_for_parse(client, headers, response.json()["id"])
+
+def test_register_applicant_from_parse_cache(client, new_user, job):
+    resume = make_resume()
+    first = new_user("applicant")
+    response = client.post("/applicants/", data={"name": "First", "email": "first@example.com"}, files={"resume": ("resume.pdf", resume, "application/pdf")}, headers=first)
+    assert wait_for_parse(client, first, response.json()["id"])["status"] == "completed"
+
+    second = new_user("applicant")
+    response = client.post("/applicants/", data={"name": "Second", "email": "second@example.com"}, files={"resume": ("resume.pdf", resume, "application/pdf")}, headers=second)
+    assert query_count(response, status_code=202) == 12
+
+def test_get_parse_job(client, new_user):
+    headers = new_user("applicant")
+    files = {"resume": ("resume.pdf", make_resume(), "application/pdf")}
+    job_id = client.post("/applicants/", data={"name": "Polling", "email": "polling@example.com"}, files=files, headers=headers).json()["id"]
+    wait_for_parse(client, headers, job_id)
+    assert query_count(client.get(f"/applicants/parse-jobs/{job_id}", headers=headers)) == 1
+
+@pytest.mark.parametrize("size", [1, 4])
+def test_bulk_ingest(client, company, job, size):
+    archive = BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for index in range(size):
+            zip_file.writestr(f"resume_{index}.pdf", make_resume())
+    response = client.post("/applicants/bulk", files={"archive": ("resumes.zip", archive.getvalue(), "application/zip")}, headers=company)
+    assert response.json()["created"] == size
+    # Per file: one parse cache lookup and one INSERT; indexing and scoring are batched
+    assert query_count(response) == 5 + 2 * size
+
+def test_job_candidates(client, company, job):
+    assert query_count(client.get(f"/matching/jobs/{job}/candidates", headers=company)) == 3
+
+def test_applicant_matches(client, applicant_user, applicant, job):
+    assert query_count(client.get(f"/matching/applicants/{applicant}/matches", headers=applicant_user)) == 3
+
+def test_delete_interview(client, company, interview):
+    assert query_count(client.delete(f"/interviews/{interview}", headers=company)) == 2
+
+def test_delete_offer(client, company, offer):
+    assert query_count(client.delete(f"/offers/{offer}", headers=company)) == 2
+
+def test_delete_job(client, company, job):
+    assert query_count(client.delete(f"/jobs/{job}", headers=company)) == 6
+
+def test_delete_applicant(client, company, job):
+    # Interviews and offers are unlinked with one UPDATE per table, however many there are;
+    # with no resume stored, no query checks whether the file is shared
+    applicant_id = create_applicant("Leaving")
+    for day in (3, 4):
+        client.post("/interviews/", json={"applicant_id": applicant_id, "position_id": job, "date_time": f"2030-01-0{day}T10:00:00"}, headers=company)
+        client.post("/offers/", json={"applicant_id": applicant_id, "position_id": job, "salary": 80000, "start_date": "2030-04-01"}, headers=company)
+    assert query_count(client.delete(f"/applicants/{applicant_id}", headers=company)) == 9
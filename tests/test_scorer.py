@@ -0,0 +1,71 @@
+"""
+The batch scorer must agree exactly with the per-pair Python scoring it replaced,
+in both its NumPy and pure Python modes.
+"""
+import random
+from typing import List
+
+import pytest
+
+from matching import scorer
+from matching.crud import normalize_skill
+
+def calculate_skill_match_percentage(job_skills: List[str], applicant_skills: List[str]) -> float:
+    """The original one-pair-at-a-time scoring, kept here as the reference"""
+    if not job_skills or not applicant_skills:
+        return 0.0
+    job_skills_lower = [normalize_skill(skill) for skill in job_skills]
+    applicant_skills_lower = [normalize_skill(skill) for skill in applicant_skills]
+    matched_skills = set(job_skills_lower) & set(applicant_skills_lower)
+    return round((len(matched_skills) / len(job_skills_lower)) * 100, 2)
+
+SKILLS = ["Python", "SQL", "React", "Docker", "AWS", "Go", "Rust", "Java", "Kubernetes", "CSS", "Figma", "Excel"]
+
+def random_skills(rng: random.Random) -> List[str]:
+    # Mixed case, padding and duplicates, as they arrive from parsed resumes and job posts
+    skills = [rng.choice(SKILLS) for _ in range(rng.randint(0, 9))]
+    return [rng.choice([skill, skill.lower(), skill.upper(), f" {skill} "]) for skill in skills]
+
+def ranking(scores: List[float]) -> List[int]:
+    """Order the endpoints return: highest score first, ties by id"""
+    return sorted(range(len(scores)), key=lambda index: (-scores[index], index))
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy_mode(request, monkeypatch):
+    if request.param and not scorer.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(scorer, "NUMPY_AVAILABLE", request.param)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_job_scores_match_reference(numpy_mode, seed):
+    rng = random.Random(seed)
+    job_skills = random_skills(rng) or ["Python"]
+    applicant_skill_lists = [random_skills(rng) for _ in range(rng.randint(1, 60))]
+
+    results = scorer.score_job_against_applicants(job_skills, applicant_skill_lists, scorer.SkillVocabulary())
+    expected = [calculate_skill_match_percentage(job_skills, skills) for skills in applicant_skill_lists]
+
+    assert [score for score, _ in results] == expected
+    assert ranking([score for score, _ in results]) == ranking(expected)
+    for (_, matched), skills in zip(results, applicant_skill_lists):
+        expected_matched = {normalize_skill(skill) for skill in job_skills} & {normalize_skill(skill) for skill in skills}
+        assert sorted(matched) == sorted(expected_matched)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_applicant_scores_match_reference(numpy_mode, seed):
+    rng = random.Random(1000 + seed)
+    applicant_skills = random_skills(rng) or ["Python"]
+    job_skill_lists = [random_skills(rng) for _ in range(rng.randint(1, 60))]
+
+    results = scorer.score_applicant_against_jobs(applicant_skills, job_skill_lists, scorer.SkillVocabulary())
+    expected = [calculate_skill_match_percentage(skills, applicant_skills) for skills in job_skill_lists]
+
+    assert [score for score, _ in results] == expected
+    assert ranking([score for score, _ in results]) == ranking(expected)
+
+def test_rounding_matches_python_for_every_fraction(numpy_mode):
+    # NumPy rounds by scaling, Python by exact decimal; they must agree on every k/n the scorer can produce
+    for denominator in range(1, 129):
+        counts = list(range(denominator + 1))
+        expected = [round((count / denominator) * 100, 2) for count in counts]
+        assert list(scorer._round_percentages(counts, [denominator] * len(counts))) == expected
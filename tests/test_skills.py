@@ -0,0 +1,42 @@
+"""Skill extraction finds listed skills without reading them into ordinary English"""
+import pytest
+
+from applicants.skills import SkillExtractor, load_skill_dictionary
+
+@pytest.fixture(scope="module")
+def extractor() -> SkillExtractor:
+    return SkillExtractor(load_skill_dictionary())
+
+@pytest.mark.parametrize("text", [
+    "I like to go to the park",
+    "Go to the park on weekends",
+    "Ready to go.",
+    "Led the R&D team",
+    "Managed the company's R&D budget",
+    "R's and Q's",
+    "a go-to person",
+    "Added 500 ml of water",
+    "said ai twice",
+    "files ending in .js or js",
+    "algorithm, cargo, rgo",
+])
+def test_ambiguous_words_are_not_skills(extractor, text):
+    assert extractor.extract(text) == []
+
+@pytest.mark.parametrize("text, skills", [
+    ("Skills: Python, Go, R, SQL", ["Python", "Go", "R", "SQL"]),
+    ("Backend services in golang", ["Go"]),
+    ("Go language, Rust", ["Go", "Rust"]),
+    ("Statistics in R.", ["Statistics", "R"]),
+    ("AI/ML research", ["Artificial Intelligence", "Machine Learning"]),
+    ("JS, TypeScript", ["JavaScript", "TypeScript"]),
+    ("c# and C++", ["C#", "C++"]),
+    ("machine\n learning and PYTHON", ["Machine Learning", "Python"]),
+])
+def test_listed_skills_are_found(extractor, text, skills):
+    assert extractor.extract(text) == skills
+
+def test_short_terms_from_custom_dictionary_are_case_sensitive():
+    extractor = SkillExtractor({"Qt": [], "Quarto": ["qto"]})
+    assert extractor.extract("Qt and qto") == ["Qt", "Quarto"]
+    assert extractor.extract("qt") == []